@@ -5,21 +5,55 @@ Test all functionality and verify enterprise-level performance
 
 import asyncio
 import aiohttp
-import json
-from datetime import datetime
+import diskcache
+import hashlib
+import orjson
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Keyword checks applied to chat responses, compiled once for a single-pass scan
+_RIDE_RE = re.compile(r"test ride|booking|appointment|schedule", re.I)
+_SVC_RE = re.compile(r"service|maintenance|package|warranty", re.I)
+
+# Canonical /chat payloads, shared read-only by every run
+_CHAT_PAYLOAD = {"message": "Hello, I need help with bike selection"}
+_RIDE_PAYLOAD = {"message": "I want to book a test ride for Honda Shine"}
+_SVC_PAYLOAD = {"message": "What are the service packages available?"}
+_EMPTY_PAYLOAD = {"message": ""}
+_HINDI_PAYLOAD = {"message": "मुझे एक अच्छी बाइक चाहिए"}
+_RECOMMENDATION_QUERIES = (
+    "I want a bike under 1 lakh",
+    "Recommend a bike for daily commuting",
+    "Best bike for long distance travel"
+)
+_RECOMMENDATION_PAYLOADS = tuple({"message": query} for query in _RECOMMENDATION_QUERIES)
+_RECOMMENDATION_BATCH = {"messages": list(_RECOMMENDATION_QUERIES)}
 
 class EnterpriseSystemTest:
-    def __init__(self):
+    def __init__(self, fail_fast=True):
         self.base_url = "http://localhost:8000"
+        # Skip the remaining tests when the health check cannot reach the server
+        self.fail_fast = fail_fast
         self.test_results = []
+        self.session: aiohttp.ClientSession | None = None
+        # Opt-in response cache for fast local reruns (TEST_USE_CACHE=1)
+        self.cache = diskcache.Cache(".test_response_cache")
+        self.use_cache = bool(os.getenv("TEST_USE_CACHE"))
+        # Wall-clock anchor; results store monotonic offsets and are formatted at summary time
+        self._t0 = datetime.now()
+        self._m0 = time.monotonic()
+        self.log_q: asyncio.Queue | None = None
         
     async def run_all_tests(self):
         """Run comprehensive system tests"""
         print("🧪 Starting Enterprise VoiceBot System Tests")
         print("="*60)
         
+        health_test = self.test_server_health
         tests = [
-            self.test_server_health,
             self.test_chat_api,
             self.test_bike_recommendations,
             self.test_test_ride_booking,
@@ -28,14 +62,58 @@ class EnterpriseSystemTest:
             self.test_multilingual_support
         ]
         
-        for test in tests:
-            try:
-                await test()
-            except Exception as e:
-                self.add_result(test.__name__, False, str(e))
+        # Progress lines go through a queue drained by a single writer task so
+        # blocking stdout writes never stall the concurrent test coroutines
+        self.log_q = asyncio.Queue()
+        writer = asyncio.create_task(self._log_writer())
+        
+        # One session for the whole run so every test reuses pooled keep-alive connections.
+        # Explicit timeouts keep a hung server from blocking the suite, and the per-host
+        # limit leaves room for the concurrent fan-out (7 tests + 3 recommendation queries).
+        timeout = aiohttp.ClientTimeout(total=15, connect=3, sock_read=10)
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        ) as self.session:
+            # The health check gates everything else: no point probing a dead server
+            await self._run_guarded(health_test)
+            if self.fail_fast and not self.test_results[-1]['passed']:
+                for test in tests:
+                    self.add_result(test.__name__, False, "Skipped: server health check failed")
+            else:
+                # Tests are independent HTTP probes, so run them concurrently
+                async with asyncio.TaskGroup() as group:
+                    for test in tests:
+                        group.create_task(self._run_guarded(test))
+        
+        await self.log_q.join()
+        writer.cancel()
+        self.log_q = None
+        
+        # Results arrive in completion order; report them in declaration order
+        order = {test.__name__: index for index, test in enumerate([health_test, *tests])}
+        self.test_results.sort(key=lambda result: order.get(result['test'], len(order)))
+        self.cache.close()
         
         self.print_summary()
     
+    async def _run_guarded(self, test):
+        """Run one test, recording any escaped exception as a failure
+        
+        Keeps a single failing test from cancelling its siblings in the TaskGroup.
+        """
+        try:
+            await test()
+        except Exception as e:
+            self.add_result(test.__name__, False, repr(e))
+    
     def add_result(self, test_name, passed, details=""):
         """Add test result"""
         status = "✅ PASS" if passed else "❌ FAIL"
@@ -44,160 +122,157 @@ class EnterpriseSystemTest:
             'status': status,
             'passed': passed,
             'details': details,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'monotonic': time.monotonic()
         })
-        print(f"{status} {test_name.replace('test_', '').replace('_', ' ').title()}")
+        line = f"{status} {test_name.replace('test_', '').replace('_', ' ').title()}\n"
         if details and not passed:
-            print(f"    Details: {details}")
+            line += f"    Details: {details}\n"
+        
+        if self.log_q is not None:
+            self.log_q.put_nowait(line)
+        else:
+            sys.stdout.write(line)
+    
+    async def _log_writer(self):
+        """Write queued progress lines to stdout"""
+        while True:
+            line = await self.log_q.get()
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            self.log_q.task_done()
     
     async def test_server_health(self):
         """Test server availability"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/") as response:
-                    if response.status == 200:
-                        self.add_result("test_server_health", True, "Server responding correctly")
-                    else:
-                        self.add_result("test_server_health", False, f"Status code: {response.status}")
+            async with self.session.get(f"{self.base_url}/") as response:
+                if response.status == 200:
+                    self.add_result("test_server_health", True, "Server responding correctly")
+                else:
+                    self.add_result("test_server_health", False, f"Status code: {response.status}")
         except Exception as e:
             self.add_result("test_server_health", False, str(e))
     
+    async def _chat(self, payload):
+        """POST a payload to /chat and return (status, data)
+        
+        Responses are always written to the on-disk cache; they are only
+        served from it when TEST_USE_CACHE is set, so CI still hits the server.
+        """
+        key = hashlib.blake2b(payload["message"].encode(), digest_size=16).hexdigest()
+        if self.use_cache and key in self.cache:
+            return self.cache[key]
+        
+        async with self.session.post(
+            f"{self.base_url}/chat",
+            json=payload
+        ) as response:
+            try:
+                data = orjson.loads(await response.read())
+            except orjson.JSONDecodeError:
+                data = {}
+            result = (response.status, data)
+        
+        self.cache[key] = result
+        return result
+    
     async def test_chat_api(self):
         """Test basic chat API functionality"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"message": "Hello, I need help with bike selection"}
-                async with session.post(
-                    f"{self.base_url}/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'response' in data and len(data['response']) > 0:
-                            self.add_result("test_chat_api", True, "Chat API responding with valid content")
-                        else:
-                            self.add_result("test_chat_api", False, "Empty or invalid response")
-                    else:
-                        self.add_result("test_chat_api", False, f"Status code: {response.status}")
+            status, data = await self._chat(_CHAT_PAYLOAD)
+            if status == 200:
+                if 'response' in data and len(data['response']) > 0:
+                    self.add_result("test_chat_api", True, "Chat API responding with valid content")
+                else:
+                    self.add_result("test_chat_api", False, "Empty or invalid response")
+            else:
+                self.add_result("test_chat_api", False, f"Status code: {status}")
         except Exception as e:
             self.add_result("test_chat_api", False, str(e))
     
     async def test_bike_recommendations(self):
         """Test bike recommendation intelligence"""
         try:
-            async with aiohttp.ClientSession() as session:
-                test_queries = [
-                    "I want a bike under 1 lakh",
-                    "Recommend a bike for daily commuting",
-                    "Best bike for long distance travel"
-                ]
+            # Send all queries in one round trip when the server exposes /chat/batch
+            async with self.session.post(
+                f"{self.base_url}/chat/batch",
+                json=_RECOMMENDATION_BATCH
+            ) as response:
+                batch_status = response.status
+                batch_data = orjson.loads(await response.read()) if batch_status == 200 else {}
+            
+            if batch_status == 200 and 'responses' in batch_data:
+                all_passed = len(batch_data['responses']) == len(_RECOMMENDATION_QUERIES) and all(
+                    len(text) >= 50 for text in batch_data['responses']
+                )
+            else:
+                # Older servers: fall back to concurrent single-message requests
+                async def check_query(payload):
+                    status, data = await self._chat(payload)
+                    return status == 200 and 'response' in data and len(data['response']) >= 50
                 
-                all_passed = True
-                for query in test_queries:
-                    payload = {"message": query}
-                    async with session.post(
-                        f"{self.base_url}/chat",
-                        json=payload,
-                        headers={"Content-Type": "application/json"}
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if 'response' not in data or len(data['response']) < 50:
-                                all_passed = False
-                                break
-                        else:
-                            all_passed = False
-                            break
+                outcomes = await asyncio.gather(*(check_query(payload) for payload in _RECOMMENDATION_PAYLOADS))
+                all_passed = all(outcomes)
                 
-                if all_passed:
-                    self.add_result("test_bike_recommendations", True, "All recommendation queries successful")
-                else:
-                    self.add_result("test_bike_recommendations", False, "Some recommendation queries failed")
+            if all_passed:
+                self.add_result("test_bike_recommendations", True, "All recommendation queries successful")
+            else:
+                self.add_result("test_bike_recommendations", False, "Some recommendation queries failed")
         except Exception as e:
             self.add_result("test_bike_recommendations", False, str(e))
     
     async def test_test_ride_booking(self):
         """Test test ride booking functionality"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"message": "I want to book a test ride for Honda Shine"}
-                async with session.post(
-                    f"{self.base_url}/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get('response', '').lower()
-                        if any(keyword in response_text for keyword in ['test ride', 'booking', 'appointment', 'schedule']):
-                            self.add_result("test_test_ride_booking", True, "Test ride booking functionality working")
-                        else:
-                            self.add_result("test_test_ride_booking", False, "No test ride booking content in response")
-                    else:
-                        self.add_result("test_test_ride_booking", False, f"Status code: {response.status}")
+            status, data = await self._chat(_RIDE_PAYLOAD)
+            if status == 200:
+                response_text = data.get('response', '')
+                if _RIDE_RE.search(response_text):
+                    self.add_result("test_test_ride_booking", True, "Test ride booking functionality working")
+                else:
+                    self.add_result("test_test_ride_booking", False, "No test ride booking content in response")
+            else:
+                self.add_result("test_test_ride_booking", False, f"Status code: {status}")
         except Exception as e:
             self.add_result("test_test_ride_booking", False, str(e))
     
     async def test_service_queries(self):
         """Test service-related queries"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"message": "What are the service packages available?"}
-                async with session.post(
-                    f"{self.base_url}/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get('response', '').lower()
-                        if any(keyword in response_text for keyword in ['service', 'maintenance', 'package', 'warranty']):
-                            self.add_result("test_service_queries", True, "Service queries handled correctly")
-                        else:
-                            self.add_result("test_service_queries", False, "No service content in response")
-                    else:
-                        self.add_result("test_service_queries", False, f"Status code: {response.status}")
+            status, data = await self._chat(_SVC_PAYLOAD)
+            if status == 200:
+                response_text = data.get('response', '')
+                if _SVC_RE.search(response_text):
+                    self.add_result("test_service_queries", True, "Service queries handled correctly")
+                else:
+                    self.add_result("test_service_queries", False, "No service content in response")
+            else:
+                self.add_result("test_service_queries", False, f"Status code: {status}")
         except Exception as e:
             self.add_result("test_service_queries", False, str(e))
     
     async def test_error_handling(self):
         """Test error handling with invalid requests"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Test empty message
-                payload = {"message": ""}
-                async with session.post(
-                    f"{self.base_url}/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    data = await response.json()
-                    if 'error' in data:
-                        self.add_result("test_error_handling", True, "Error handling working correctly")
-                    else:
-                        self.add_result("test_error_handling", False, "No error returned for empty message")
+            # Test empty message
+            _, data = await self._chat(_EMPTY_PAYLOAD)
+            if 'error' in data:
+                self.add_result("test_error_handling", True, "Error handling working correctly")
+            else:
+                self.add_result("test_error_handling", False, "No error returned for empty message")
         except Exception as e:
             self.add_result("test_error_handling", False, str(e))
     
     async def test_multilingual_support(self):
         """Test multilingual query handling"""
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"message": "मुझे एक अच्छी बाइक चाहिए"}  # Hindi
-                async with session.post(
-                    f"{self.base_url}/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'response' in data and len(data['response']) > 0:
-                            self.add_result("test_multilingual_support", True, "Multilingual support working")
-                        else:
-                            self.add_result("test_multilingual_support", False, "No response for Hindi query")
-                    else:
-                        self.add_result("test_multilingual_support", False, f"Status code: {response.status}")
+            status, data = await self._chat(_HINDI_PAYLOAD)
+            if status == 200:
+                if 'response' in data and len(data['response']) > 0:
+                    self.add_result("test_multilingual_support", True, "Multilingual support working")
+                else:
+                    self.add_result("test_multilingual_support", False, "No response for Hindi query")
+            else:
+                self.add_result("test_multilingual_support", False, f"Status code: {status}")
         except Exception as e:
             self.add_result("test_multilingual_support", False, str(e))
     
@@ -207,6 +282,10 @@ class EnterpriseSystemTest:
         print("🏆 ENTERPRISE SYSTEM TEST SUMMARY")
         print("="*60)
         
+        for result in self.test_results:
+            stamp = self._t0 + timedelta(seconds=result['monotonic'] - self._m0)
+            result['timestamp'] = stamp.strftime('%H:%M:%S')
+        
         passed_tests = sum(1 for result in self.test_results if result['passed'])
         total_tests = len(self.test_results)
         success_rate = (passed_tests / total_tests) * 100 if total_tests > 0 else 0
@@ -244,7 +323,7 @@ class EnterpriseSystemTest:
 
 async def main():
     """Run the enterprise system test"""
-    tester = EnterpriseSystemTest()
+    tester = EnterpriseSystemTest(fail_fast="--no-fail-fast" not in sys.argv)
     await tester.run_all_tests()
 
 if __name__ == "__main__":
@@ -252,8 +331,16 @@ if __name__ == "__main__":
     print("Testing all enterprise-level functionality...")
     print("")
     
+    # uvloop cuts per-callback event loop overhead when it is available
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n⏸️  Test interrupted by user")
     except Exception as e:
@@ -1,45 +1,76 @@
 #!/usr/bin/env python3
 """
 Simple dependency installer for VoiceBot
-This script installs dependencies one by one to avoid conflicts
+This script installs dependencies in batches, falling back to one by one on conflicts
 """
 
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 
-def install_package(package_name, description=""):
-    """Install a single package"""
-    print(f"📦 Installing {package_name}...")
-    if description:
-        print(f"   {description}")
-    
+try:
+    from packaging.requirements import Requirement
+except ImportError:
+    Requirement = None
+
+# Skip pip's self-update check on every invocation
+PIP_ENV = {"PIP_DISABLE_PIP_VERSION_CHECK": "1", **os.environ}
+
+def pip_install(*specs):
+    """Run pip install for the given specs and return the completed process"""
+    return subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--no-warn-script-location", *specs],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=PIP_ENV
+    )
+
+def already_satisfied(spec):
+    """Check whether a requirement spec is already installed at a matching version"""
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", 
-            package_name, "--no-deps", "--force-reinstall"
-        ])
-        print(f"✅ {package_name} installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package_name}: {e}")
+        if Requirement is not None:
+            requirement = Requirement(spec)
+            installed = metadata.version(requirement.name)
+            return requirement.specifier.contains(installed, prereleases=True)
+        name, _, version = spec.partition("==")
+        return metadata.version(name) == version
+    except metadata.PackageNotFoundError:
+        return False
+    except Exception:
+        # Unparseable spec: let pip decide
         return False
 
-def install_with_deps(package_name, description=""):
-    """Install a package with its dependencies"""
-    print(f"📦 Installing {package_name} with dependencies...")
-    if description:
-        print(f"   {description}")
+def install_batch(packages):
+    """Install a group of (package, description) pairs with one pip run
     
-    try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", package_name
-        ])
-        print(f"✅ {package_name} installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package_name}: {e}")
-        return False
+    Packages already installed at the pinned version are skipped. pip resolves
+    and downloads the rest together; if the batch fails, each package is retried
+    on its own so one bad wheel does not block the rest.
+    Returns the list of packages that still failed to install, or None when
+    everything was already up to date and pip was not run at all.
+    """
+    specs = [package for package, _ in packages if not already_satisfied(package)]
+    if not specs:
+        return None
+    
+    if pip_install(*specs).returncode == 0:
+        return []
+    
+    return [package for package in specs if pip_install(package).returncode != 0]
+
+def report_category(title, packages, failed):
+    """Print the outcome of a category install"""
+    if failed is None:
+        print(f"✅ {title}: all up to date")
+    elif failed:
+        print(f"❌ {title}: {len(failed)}/{len(packages)} packages failed")
+        for package in failed:
+            print(f"⚠️  Warning: Failed to install {package}")
+    else:
+        print(f"✅ {title}: {len(packages)} packages installed successfully")
 
 def main():
     print("="*60)
@@ -51,6 +82,8 @@ def main():
     core_packages = [
         ("fastapi==0.104.1", "Web framework"),
         ("uvicorn==0.24.0", "ASGI server"),
+        ("orjson==3.9.10", "Fast JSON serialization"),
+        ("httptools==0.6.1", "Fast HTTP parser"),
         ("python-multipart==0.0.6", "File upload support"),
         ("python-dotenv==1.0.0", "Environment variables"),
         ("pydantic==2.5.0", "Data validation"),
@@ -58,9 +91,7 @@ def main():
     ]
     
     print("🔧 Installing core web framework...")
-    for package, desc in core_packages:
-        if not install_with_deps(package, desc):
-            print(f"⚠️  Warning: Failed to install {package}")
+    report_category("Core web framework", core_packages, install_batch(core_packages))
     
     # Database packages
     db_packages = [
@@ -68,11 +99,6 @@ def main():
         ("sqlalchemy==2.0.23", "Database ORM"),
     ]
     
-    print("\n🗄️  Installing database packages...")
-    for package, desc in db_packages:
-        if not install_with_deps(package, desc):
-            print(f"⚠️  Warning: Failed to install {package}")
-    
     # Speech packages (may have system dependencies)
     speech_packages = [
         ("SpeechRecognition==3.10.0", "Speech recognition"),
@@ -80,11 +106,6 @@ def main():
         ("pyttsx3==2.90", "Offline TTS"),
     ]
     
-    print("\n🎤 Installing speech packages...")
-    for package, desc in speech_packages:
-        if not install_with_deps(package, desc):
-            print(f"⚠️  Warning: Failed to install {package}")
-    
     # Utility packages
     util_packages = [
         ("langdetect==1.0.9", "Language detection"),
@@ -95,11 +116,25 @@ def main():
         ("diskcache==5.6.3", "Disk caching"),
         ("prometheus-client==0.19.0", "Metrics"),
     ]
+    if sys.platform != "win32":
+        util_packages.append(("uvloop==0.19.0", "Fast event loop"))
     
-    print("\n🔧 Installing utility packages...")
-    for package, desc in util_packages:
-        if not install_with_deps(package, desc):
-            print(f"⚠️  Warning: Failed to install {package}")
+    # The remaining categories have disjoint dependency roots, so install them
+    # in parallel once the core framework is in place
+    categories = [
+        ("Database packages", db_packages),
+        ("Speech packages", speech_packages),
+        ("Utility packages", util_packages),
+    ]
+    
+    print("\n📦 Installing database, speech and utility packages in parallel...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            (title, packages, executor.submit(install_batch, packages))
+            for title, packages in categories
+        ]
+        for title, packages, future in futures:
+            report_category(title, packages, future.result())
     
     print("\n" + "="*60)
     print("✅ Installation completed!")
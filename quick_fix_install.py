@@ -3,6 +3,7 @@ Quick Fix for MySQL-python Installation Error
 This script bypasses the problematic dependencies and installs only what we need.
 """
 
+import shlex
 import subprocess
 import sys
 import os
@@ -27,17 +28,15 @@ def main():
     print("without problematic dependencies like MySQL-python")
     print()
     
-    # Clean pip cache first
-    print("🧹 Cleaning pip cache...")
-    run_command(f"{sys.executable} -m pip cache purge", "Clearing cache")
-    
     # Upgrade pip
     run_command(f"{sys.executable} -m pip install --upgrade pip", "Upgrading pip")
     
-    # Install packages one by one
+    # Essential packages, installed with a single pip run
     packages = [
         "fastapi==0.104.1",
         "uvicorn==0.24.0", 
+        "orjson==3.9.10",
+        "httptools==0.6.1",
         "python-multipart==0.0.6",
         "python-dotenv==1.0.0",
         "pydantic==2.5.0",
@@ -53,13 +52,23 @@ def main():
         "prometheus-client==0.19.0"
     ]
     
+    # uvloop does not support Windows
+    if sys.platform != "win32":
+        packages.append("uvloop==0.19.0")
+
     print("\n📦 Installing essential packages...")
     failed_packages = []
     
-    for package in packages:
-        print(f"\n   Installing {package}...")
-        if not run_command(f"{sys.executable} -m pip install {package}", f"Installing {package}"):
-            failed_packages.append(package)
+    # One resolver pass for everything; wheels preferred over source builds and
+    # streamed straight into site-packages without touching the pip cache
+    pip_install = f"{sys.executable} -m pip install --prefer-binary --no-cache-dir"
+    specs = " ".join(shlex.quote(package) for package in packages)
+    if not run_command(f"{pip_install} {specs}", "Installing all packages"):
+        # Retry one by one to find out which packages are at fault
+        for package in packages:
+            print(f"\n   Installing {package}...")
+            if not run_command(f"{pip_install} {shlex.quote(package)}", f"Installing {package}"):
+                failed_packages.append(package)
     
     # Create directories
     print("\n📁 Creating directories...")
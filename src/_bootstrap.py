@@ -0,0 +1,84 @@
+"""
+Optional imports and availability flags for the application entry point.
+Each subsystem is imported defensively so the app still starts (e.g. on
+Vercel) when a dependency or module is missing; missing pieces are None.
+"""
+import os
+
+# Vercel sets VERCEL in every serverless invocation
+IS_SERVERLESS = bool(os.getenv("VERCEL"))
+
+# Import your modules with error handling for Vercel deployment
+try:
+    from src.api import voice_routes, booking_routes, service_routes
+    ROUTES_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import routes: {e}")
+    voice_routes = booking_routes = service_routes = None
+    ROUTES_AVAILABLE = False
+
+try:
+    from src.core.config import get_settings, ensure_dirs
+    settings = get_settings()
+    CONFIG_AVAILABLE = True
+except ImportError:
+    # Fallback settings for Vercel deployment
+    class FallbackSettings:
+        PROJECT_NAME = "AI Sales Assistant Chatbot"
+        API_VERSION = "v1"
+        ALLOWED_HOSTS = ["*"]
+        DEBUG = False
+        HOST = "0.0.0.0"
+        PORT = 8000
+        LOG_LEVEL = "INFO"
+        ENABLE_METRICS = False
+        PROMETHEUS_PORT = 8001
+    
+    settings = FallbackSettings()
+    ensure_dirs = None
+    CONFIG_AVAILABLE = False
+
+try:
+    from src.infrastructure.database import db_service
+    from src.services.interaction_batcher import interaction_batcher
+    DB_AVAILABLE = True
+except ImportError:
+    db_service = interaction_batcher = None
+    DB_AVAILABLE = False
+
+try:
+    from src.domain.exceptions import VoiceBotException
+except ImportError:
+    VoiceBotException = None
+
+try:
+    from src.services.notification_queue import notification_queue
+    NOTIFICATIONS_AVAILABLE = True
+except ImportError:
+    notification_queue = None
+    NOTIFICATIONS_AVAILABLE = False
+
+try:
+    from src.infrastructure.middleware import MonitoringMiddleware, RateLimitMiddleware
+    MIDDLEWARE_AVAILABLE = True
+except ImportError:
+    MonitoringMiddleware = RateLimitMiddleware = None
+    MIDDLEWARE_AVAILABLE = False
+
+try:
+    from src.infrastructure.logging import logger
+    LOGGING_AVAILABLE = True
+except ImportError:
+    # Always a real logger, so call sites never need to check for one
+    import logging
+    logger = logging.getLogger("voicebot")
+    logger.addHandler(logging.NullHandler())
+    LOGGING_AVAILABLE = False
+
+# Remove Prometheus import for serverless
+try:
+    from prometheus_client import start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    start_http_server = None
+    PROMETHEUS_AVAILABLE = False
@@ -9,12 +9,21 @@ from src.models.schemas import (
     CustomerResponse, APIResponse, ErrorResponse, BookingStatus
 )
 from src.infrastructure.database import db_service
-from src.services.notification_service import notification_service
+from src.domain.exceptions import VoiceBotException
+from src.services.notification_queue import notification_queue
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Test drive slots within business hours (9 AM - 6 PM, 60 minute slots)
+SLOTS = tuple(f"{hour:02d}:00" for hour in range(9, 18))
+
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD path parameter into midnight of that day"""
+    # date.fromisoformat is implemented in C and skips strptime's format machinery
+    return datetime.combine(date.fromisoformat(value), time.min)
+
 @router.post("/test-drive", response_model=BookingResponse)
 async def book_test_drive(booking: BookingCreate):
     """
@@ -26,14 +35,6 @@ async def book_test_drive(booking: BookingCreate):
     - **location**: Location for the test drive
     """
     try:
-        # Verify customer exists
-        customer = await db_service.get_customer(booking.customer_id)
-        if not customer:
-            raise HTTPException(
-                status_code=404,
-                detail="Customer not found"
-            )
-
         # Check if the preferred date is in the future
         if booking.preferred_date <= datetime.now():
             raise HTTPException(
@@ -41,36 +42,37 @@ async def book_test_drive(booking: BookingCreate):
                 detail="Preferred date must be in the future"
             )
 
-        # Create booking
-        booking_data = booking.model_dump()
-        booking_id = await db_service.create_booking(booking_data)
-        
-        # Get created booking
-        created_booking = await db_service.get_booking(booking_id)
-        if not created_booking:
+        # Verify customer exists
+        customer = await db_service.get_customer(booking.customer_id)
+        if not customer:
             raise HTTPException(
-                status_code=500,
-                detail="Failed to retrieve created booking"
+                status_code=404,
+                detail="Customer not found"
             )
 
-        # Send confirmation email if customer has email
+        # Create booking; the stored row comes back with it, so no re-read is needed
+        booking_data = booking.model_dump()
+        created_booking = await db_service.create_booking(booking_data, returning=True)
+        booking_id = created_booking.id
+
+        # Queue confirmation email if customer has email; the response does
+        # not wait for the SMTP round-trip
         if customer.email:
-            try:
-                await notification_service.send_booking_confirmation(
-                    email=customer.email,
-                    booking_details={
-                        'id': booking_id,
-                        'vehicle_model': booking.vehicle_model,
-                        'preferred_date': booking.preferred_date,
-                        'location': booking.location,
-                        'status': 'confirmed'
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Failed to send booking confirmation email: {e}")
+            notification_queue.enqueue(
+                "booking_confirmation",
+                email=customer.email,
+                booking_details={
+                    'id': booking_id,
+                    'vehicle_model': booking.vehicle_model,
+                    'preferred_date': booking.preferred_date,
+                    'location': booking.location,
+                    'status': 'confirmed'
+                }
+            )
 
-        # Convert to response model
-        return BookingResponse(
+        # Convert to response model; the row is already typed by the DB layer,
+        # so skip re-validating it
+        return BookingResponse.model_construct(
             id=created_booking.id,
             customer_id=created_booking.customer_id,
             vehicle_model=created_booking.vehicle_model,
@@ -80,12 +82,10 @@ async def book_test_drive(booking: BookingCreate):
             created_at=created_booking.created_at
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to book test drive: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Failed to book test drive: {e.message}")
         raise HTTPException(
-            status_code=500,
+            status_code=e.status_code,
             detail="Failed to process booking request"
         )
 
@@ -99,41 +99,13 @@ async def get_available_slots(
     """
     try:
         # Convert date string to datetime
-        booking_date = datetime.strptime(date, "%Y-%m-%d")
-        
-        # Business hours
-        BUSINESS_HOURS = {
-            'start': time(9, 0),  # 9 AM
-            'end': time(18, 0),   # 6 PM
-            'slot_duration': 60    # 60 minutes
-        }
+        booking_date = _parse_date(date)
         
-        # Get existing bookings for the date
-        existing_bookings = await db_service.get_bookings_for_date(
-            booking_date,
-            location
-        )
-        
-        # Calculate available slots
-        available_slots = []
-        current_time = BUSINESS_HOURS['start']
+        # Only the distinct booked times come back from the database
+        booked = await db_service.get_booked_slots(booking_date, location)
         
-        while current_time < BUSINESS_HOURS['end']:
-            slot = current_time.strftime("%H:%M")
-            
-            # Check if slot is available
-            if not any(
-                booking['preferred_time'] == slot
-                for booking in existing_bookings
-            ):
-                available_slots.append(slot)
-            
-            # Move to next slot
-            hours, minutes = divmod(
-                current_time.hour * 60 + current_time.minute + BUSINESS_HOURS['slot_duration'],
-                60
-            )
-            current_time = time(hours, minutes)
+        # Free slots are the business-hour slots nobody has booked
+        available_slots = [slot for slot in SLOTS if slot not in booked]
         
         return {
             "date": date,
@@ -145,10 +117,10 @@ async def get_available_slots(
             status_code=400,
             detail="Invalid date format. Use YYYY-MM-DD"
         )
-    except Exception as e:
-        logger.error(f"Failed to get available slots: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Failed to get available slots: {e.message}")
         raise HTTPException(
-            status_code=500,
+            status_code=e.status_code,
             detail="Failed to retrieve available slots"
         )
 
@@ -174,11 +146,9 @@ async def get_booking_status(booking_id: int):
                 "location": booking.location
             }
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get booking status: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Failed to get booking status: {e.message}")
         raise HTTPException(
-            status_code=500,
+            status_code=e.status_code,
             detail="Failed to retrieve booking status"
         )
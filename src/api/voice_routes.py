@@ -2,8 +2,8 @@
 Voice API routes for speech recognition and text-to-speech operations.
 Handles audio processing, multilingual support, and conversation management.
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Query, Request
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from src.services.voice_service import voice_service
 from src.models.schemas import (
     SpeechToTextRequest, SpeechToTextResponse,
@@ -11,15 +11,117 @@ from src.models.schemas import (
     APIResponse, ErrorResponse
 )
 from src.utils.sentiment_analyzer import sentiment_analyzer
-from src.infrastructure.database import db_service
+from src.services.interaction_batcher import interaction_batcher
+from src.domain.exceptions import VoiceBotException
+from src.core.config import get_settings
+from types import MappingProxyType
 from typing import Optional
 import logging
 from datetime import datetime
 import base64
+import hashlib
+import hmac
+import orjson
+import os
+import tempfile
+import time
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 router = APIRouter()
 
+# Uploads are copied in chunks; small ones stay in memory, larger ones spill to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_SPOOL_MAX_MEMORY = 1 << 20
+
+def _audio_signature(filename: str, expires: int) -> str:
+    """HMAC of an audio filename and expiry, keyed with the app secret"""
+    message = f"{filename}.{expires}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+def _sign_audio_token(filename: str) -> str:
+    """Build a "<filename>.<expires>.<signature>" token valid for AUDIO_URL_TTL seconds"""
+    expires = int(time.time()) + settings.AUDIO_URL_TTL
+    return f"{filename}.{expires}.{_audio_signature(filename, expires)}"
+
+def _verify_audio_token(token: str) -> Optional[str]:
+    """Return the filename of a valid, unexpired token, otherwise None"""
+    try:
+        filename, expires, signature = token.rsplit(".", 2)
+        expires = int(expires)
+    except ValueError:
+        return None
+    if os.path.basename(filename) != filename or expires < time.time():
+        return None
+    if not hmac.compare_digest(signature, _audio_signature(filename, expires)):
+        return None
+    return filename
+
+def _validate_audio_upload(audio: UploadFile):
+    """Reject uploads with a non-audio type or a declared size over the limit"""
+    if not audio.content_type or not audio.content_type.startswith('audio/'):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload an audio file."
+        )
+    if audio.size is not None and audio.size > settings.MAX_AUDIO_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Audio file too large")
+
+async def _spool_upload(audio: UploadFile) -> tempfile.SpooledTemporaryFile:
+    """
+    Copy an upload into a spooled temporary file in fixed-size chunks.
+    
+    The whole payload is never held as one bytes object; the spool is
+    rewound and ready to read. Raises 400 if empty and 413 if too large.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
+    size = 0
+    while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > settings.MAX_AUDIO_UPLOAD_BYTES:
+            spool.close()
+            raise HTTPException(status_code=413, detail="Audio file too large")
+        spool.write(chunk)
+    
+    if size == 0:
+        spool.close()
+        raise HTTPException(
+            status_code=400,
+            detail="Empty audio file"
+        )
+    
+    spool.seek(0)
+    return spool
+
+# Display names for the language codes voice_service may support (read-only)
+LANGUAGE_INFO = MappingProxyType({
+    "en-IN": {"name": "English (India)", "native_name": "English"},
+    "hi-IN": {"name": "Hindi", "native_name": "हिन्दी"},
+    "ta-IN": {"name": "Tamil", "native_name": "தமிழ்"},
+    "te-IN": {"name": "Telugu", "native_name": "తెలుగు"},
+    "mr-IN": {"name": "Marathi", "native_name": "मराठी"},
+    "gu-IN": {"name": "Gujarati", "native_name": "ગુજરાતી"},
+    "bn-IN": {"name": "Bengali", "native_name": "বাংলা"}
+})
+
+# Supported languages come from settings and never change at runtime, so the
+# /languages payload is built once at import
+_SUPPORTED_LANGUAGES = [
+    {"code": code, **LANGUAGE_INFO[code]}
+    for code in voice_service.get_supported_languages()
+    if code in LANGUAGE_INFO
+]
+LANGUAGES_RESPONSE = {
+    "supported_languages": _SUPPORTED_LANGUAGES,
+    "default_language": voice_service.default_language,
+    "total_count": len(_SUPPORTED_LANGUAGES)
+}
+_LANGUAGES_BODY = orjson.dumps(LANGUAGES_RESPONSE)
+_LANGUAGES_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.md5(_LANGUAGES_BODY).hexdigest()}"'
+}
+
 @router.post("/speech-to-text", response_model=SpeechToTextResponse)
 async def speech_to_text(
     audio: UploadFile = File(..., description="Audio file (WAV, MP3, etc.)"),
@@ -34,29 +136,17 @@ async def speech_to_text(
     - **customer_id**: Optional customer ID for conversation tracking
     """
     try:
-        # Validate file type
-        if not audio.content_type or not audio.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Please upload an audio file."
-            )
+        # Validate file type and declared size before reading
+        _validate_audio_upload(audio)
 
-        # Read audio data
-        audio_data = await audio.read()
-        
-        if len(audio_data) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Empty audio file"
+        # Stream audio data into a spool and process voice input
+        with await _spool_upload(audio) as audio_data:
+            result = await voice_service.process_voice_input(
+                audio_data=audio_data,
+                customer_id=customer_id,
+                language=language
             )
 
-        # Process voice input
-        result = await voice_service.process_voice_input(
-            audio_data=audio_data,
-            customer_id=customer_id,
-            language=language
-        )
-
         return SpeechToTextResponse(
             text=result["text"],
             language=result["language"],
@@ -64,13 +154,11 @@ async def speech_to_text(
             sentiment_score=result["sentiment"]["score"]
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Speech-to-text conversion failed: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Speech-to-text conversion failed: {e.message}")
         raise HTTPException(
-            status_code=500,
-            detail=f"Speech recognition failed: {str(e)}"
+            status_code=e.status_code,
+            detail=f"Speech recognition failed: {e.message}"
         )
 
 @router.post("/text-to-speech")
@@ -104,31 +192,32 @@ async def text_to_speech(
             }
         )
 
-    except Exception as e:
-        logger.error(f"Text-to-speech conversion failed: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Text-to-speech conversion failed: {e.message}")
         raise HTTPException(
-            status_code=500,
-            detail=f"Text-to-speech conversion failed: {str(e)}"
+            status_code=e.status_code,
+            detail=f"Text-to-speech conversion failed: {e.message}"
         )
 
 @router.post("/conversation", response_model=dict)
 async def process_conversation(
+    request: Request,
     audio: UploadFile = File(..., description="Audio input"),
     customer_id: Optional[int] = Form(None, description="Customer ID"),
     language: Optional[str] = Form(None, description="Preferred language"),
-    conversation_id: Optional[str] = Form(None, description="Conversation ID for context")
+    conversation_id: Optional[str] = Form(None, description="Conversation ID for context"),
+    inline: bool = Query(False, description="Embed the response audio as base64 (legacy clients)")
 ):
     """
     Process a complete conversation turn: speech input → text → response → speech output.
     
-    This endpoint handles the full conversation pipeline and returns both text and audio response.
+    This endpoint handles the full conversation pipeline and returns the text response
+    with a short-lived `audio_url` for the raw audio. Pass `inline=1` to receive the
+    audio as `audio_base64` instead.
     """
     try:
-        # Read audio data
-        audio_data = await audio.read()
-        
-        if len(audio_data) == 0:
-            raise HTTPException(status_code=400, detail="Empty audio file")
+        # Validate file type and declared size before reading
+        _validate_audio_upload(audio)
 
         # Prepare context
         context = {
@@ -136,18 +225,31 @@ async def process_conversation(
             "turn_number": 1  # This would be tracked in a real implementation
         }
 
-        # Process conversation turn
-        result = await voice_service.process_conversation_turn(
-            audio_data=audio_data,
-            customer_id=customer_id,
-            language=language,
-            context=context
-        )
+        # Stream audio data into a spool and process the conversation turn
+        with await _spool_upload(audio) as audio_data:
+            result = await voice_service.process_conversation_turn(
+                audio_data=audio_data,
+                customer_id=customer_id,
+                language=language,
+                context=context
+            )
 
-        # Encode audio data as base64 for JSON response
-        audio_base64 = base64.b64encode(result["response"]["voice"]["audio_data"]).decode('utf-8')
+        voice = result["response"]["voice"]
+        response_audio = {
+            "text": result["response"]["text"],
+            "language": voice["language"],
+            "audio_filename": voice["audio_filename"]
+        }
+        if inline:
+            # Encode audio data as base64 for JSON response
+            response_audio["audio_base64"] = base64.b64encode(voice["audio_data"]).decode('utf-8')
+        else:
+            # The audio is already saved; hand out a signed link to fetch it raw
+            response_audio["audio_url"] = str(request.url_for(
+                "get_conversation_audio", token=_sign_audio_token(voice["audio_filename"])
+            ))
 
-        return {
+        return ORJSONResponse({
             "conversation_id": result.get("conversation_id"),
             "turn_number": result.get("turn_number"),
             "input": {
@@ -156,64 +258,42 @@ async def process_conversation(
                 "confidence": result["input"]["confidence"],
                 "sentiment": result["input"]["sentiment"]
             },
-            "response": {
-                "text": result["response"]["text"],
-                "language": result["response"]["voice"]["language"],
-                "audio_base64": audio_base64,
-                "audio_filename": result["response"]["voice"]["audio_filename"]
-            },
+            "response": response_audio,
             "timestamp": result["input"]["timestamp"]
-        }
+        })
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Conversation processing failed: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Conversation processing failed: {e.message}")
         raise HTTPException(
-            status_code=500,
-            detail=f"Conversation processing failed: {str(e)}"
+            status_code=e.status_code,
+            detail=f"Conversation processing failed: {e.message}"
         )
 
+@router.get("/audio/{token}", name="get_conversation_audio")
+async def get_conversation_audio(token: str):
+    """
+    Stream a generated response audio file referenced by a signed, expiring token.
+    """
+    filename = _verify_audio_token(token)
+    if filename is None:
+        raise HTTPException(status_code=404, detail="Audio not found or link expired")
+    
+    path = os.path.join(settings.AUDIO_STORAGE, filename)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Audio not found or link expired")
+    
+    return FileResponse(path, media_type="audio/mp3", filename=filename)
+
 @router.get("/languages", response_model=dict)
-async def get_supported_languages():
+async def get_supported_languages(request: Request):
     """
     Get list of supported languages for speech recognition and text-to-speech.
+    
+    The payload is static, so clients may cache it and revalidate with If-None-Match.
     """
-    try:
-        languages = voice_service.get_supported_languages()
-        
-        # Map language codes to names
-        language_info = {
-            "en-IN": {"name": "English (India)", "native_name": "English"},
-            "hi-IN": {"name": "Hindi", "native_name": "हिन्दी"},
-            "ta-IN": {"name": "Tamil", "native_name": "தமிழ்"},
-            "te-IN": {"name": "Telugu", "native_name": "తెలుగు"},
-            "mr-IN": {"name": "Marathi", "native_name": "मराठी"},
-            "gu-IN": {"name": "Gujarati", "native_name": "ગુજરાતી"},
-            "bn-IN": {"name": "Bengali", "native_name": "বাংলা"}
-        }
-
-        supported_languages = []
-        for lang_code in languages:
-            if lang_code in language_info:
-                supported_languages.append({
-                    "code": lang_code,
-                    "name": language_info[lang_code]["name"],
-                    "native_name": language_info[lang_code]["native_name"]
-                })
-
-        return {
-            "supported_languages": supported_languages,
-            "default_language": voice_service.default_language,
-            "total_count": len(supported_languages)
-        }
-
-    except Exception as e:
-        logger.error(f"Failed to get supported languages: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to retrieve supported languages"
-        )
+    if _LANGUAGES_HEADERS["ETag"] in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=_LANGUAGES_HEADERS)
+    return Response(content=_LANGUAGES_BODY, media_type="application/json", headers=_LANGUAGES_HEADERS)
 
 @router.get("/conversation/history/{customer_id}", response_model=dict)
 async def get_conversation_history(
@@ -232,10 +312,10 @@ async def get_conversation_history(
             "interactions": history
         }
 
-    except Exception as e:
-        logger.error(f"Failed to get conversation history: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Failed to get conversation history: {e.message}")
         raise HTTPException(
-            status_code=500,
+            status_code=e.status_code,
             detail="Failed to retrieve conversation history"
         )
 
@@ -263,9 +343,9 @@ async def analyze_text_sentiment(
                     "content": text,
                     "sentiment_score": sentiment_details["compound"]
                 }
-                interaction_id = await db_service.create_interaction(interaction_data)
-            except Exception as e:
-                logger.warning(f"Failed to store sentiment interaction: {e}")
+                interaction_id = await interaction_batcher.add(interaction_data)
+            except VoiceBotException as e:
+                logger.warning(f"Failed to store sentiment interaction: {e.message}")
 
         return {
             "text": text,
@@ -274,11 +354,11 @@ async def analyze_text_sentiment(
             "timestamp": datetime.utcnow().isoformat()
         }
 
-    except Exception as e:
-        logger.error(f"Sentiment analysis failed: {str(e)}")
+    except VoiceBotException as e:
+        logger.error(f"Sentiment analysis failed: {e.message}")
         raise HTTPException(
-            status_code=500,
-            detail=f"Sentiment analysis failed: {str(e)}"
+            status_code=e.status_code,
+            detail=f"Sentiment analysis failed: {e.message}"
         )
 
 @router.get("/health", response_model=dict)
@@ -291,11 +371,15 @@ async def voice_service_health():
         
         overall_status = "healthy" if all(health.values()) else "unhealthy"
         
-        return {
-            "status": overall_status,
-            "components": health,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        # Let dashboards polling in a tight loop reuse a result for a few seconds
+        return ORJSONResponse(
+            {
+                "status": overall_status,
+                "components": health,
+                "timestamp": datetime.utcnow().isoformat()
+            },
+            headers={"Cache-Control": "private, max-age=5"}
+        )
 
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
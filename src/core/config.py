@@ -3,7 +3,7 @@ Core configuration settings for the VoiceBot system.
 Handles all environment variables and system-wide settings.
 """
 from functools import lru_cache
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
 import os
@@ -25,6 +25,15 @@ class Settings(BaseSettings):
     # Database Configuration
     DB_TYPE: str = "sqlite"
     DB_PATH: str = "./data/voicebot.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600
+    DB_BUSY_TIMEOUT_MS: int = 5000
+    CUSTOMER_CACHE_SIZE: int = 1024
+    CUSTOMER_CACHE_TTL: int = 60
+    # Interaction rows are inserted in batches of up to this many, waiting at most this long
+    INTERACTION_BATCH_SIZE: int = 500
+    INTERACTION_BATCH_WAIT: float = 0.05
     
     # Cache Configuration
     CACHE_TYPE: str = "filesystem"
@@ -36,22 +45,28 @@ class Settings(BaseSettings):
     ENABLE_WEBSPEECH: bool = True
     TTS_SERVICE: str = "gtts"
     TTS_LANGUAGE_FALLBACK: str = "en"
+    MAX_AUDIO_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    AUDIO_URL_TTL: int = 300
     
     # Supported Languages
-    SUPPORTED_LANGUAGES: List[str] = [
+    SUPPORTED_LANGUAGES: Tuple[str, ...] = (
         "en-IN", "hi-IN", "ta-IN", "te-IN", 
         "mr-IN", "gu-IN", "bn-IN"
-    ]
+    )
     
     # Performance Settings
     MAX_CONCURRENT_CALLS: int = 50
     RESPONSE_TIMEOUT: float = 3.0
     RATE_LIMIT_CALLS: int = 100
     RATE_LIMIT_PERIOD: int = 3600
+    # Share rate-limit counters across workers via Redis (e.g. redis://localhost:6379/0)
+    RATE_LIMIT_REDIS_URL: str = ""
 
     # Monitoring
     ENABLE_METRICS: bool = True
     PROMETHEUS_PORT: int = 9090
+    # Count SQL statements per request (always on with DEBUG); for catching N+1 queries in CI
+    TRACK_QUERY_COUNT: bool = False
     LOG_LEVEL: str = "INFO"
 
     # Email Configuration (Free SMTP)
@@ -60,18 +75,13 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
     ENABLE_EMAIL_NOTIFICATIONS: bool = False
+    NOTIFY_WORKERS: int = 4
 
     # Storage Configuration
     DATA_DIR: str = "./data"
     LOGS_DIR: str = "./logs"
     AUDIO_STORAGE: str = "./data/audio"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Create directories if they don't exist
-        for dir_path in [self.DATA_DIR, self.LOGS_DIR, self.AUDIO_STORAGE, self.CACHE_DIR]:
-            os.makedirs(dir_path, exist_ok=True)
-
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -82,3 +92,11 @@ def get_settings() -> Settings:
     Returns cached settings instance to avoid reading the environment each time.
     """
     return Settings()
+
+def ensure_dirs(settings: Settings) -> None:
+    """
+    Create the data, log, audio and cache directories if they don't exist.
+    Called once at application startup rather than on every Settings instantiation.
+    """
+    for dir_path in (settings.DATA_DIR, settings.LOGS_DIR, settings.AUDIO_STORAGE, settings.CACHE_DIR):
+        os.makedirs(dir_path, exist_ok=True)
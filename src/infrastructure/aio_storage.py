@@ -0,0 +1,31 @@
+"""
+Async file storage helpers for audio artifacts.
+Each write runs as a single blocking open/write/close in a worker thread, so the
+event loop is never blocked and only one thread hand-off is paid per file.
+"""
+import asyncio
+import os
+
+def _write_file(path: str, data: bytes):
+    """Write data to path, creating the parent directory on first use"""
+    try:
+        with open(path, 'wb') as f:
+            f.write(data)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+
+async def write_audio(path: str, data: bytes) -> str:
+    """
+    Persist an audio blob without blocking the event loop.
+
+    Args:
+        path: Destination file path
+        data: Audio bytes
+
+    Returns:
+        The path written
+    """
+    await asyncio.to_thread(_write_file, path, data)
+    return path
@@ -2,26 +2,99 @@
 Database service implementation using SQLite with SQLAlchemy async.
 Handles all database operations with proper connection pooling and error handling.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Index
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
+from sqlalchemy.orm import relationship, Mapped, mapped_column, selectinload, make_transient_to_detached
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine, AsyncConnection
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy import select, update, delete
-from typing import Optional, List, Dict, Any, AsyncGenerator
+from sqlalchemy import select, insert, update, delete, func, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import Optional, List, Dict, Any, AsyncGenerator, Set, Union, Iterable, Iterator, Tuple
 from src.core.config import get_settings
 from src.domain.exceptions import DatabaseError
 import asyncio
-from datetime import datetime
-from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from collections import OrderedDict
+import functools
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 import logging
 import os
+import time
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 Base = declarative_base()
 
+# Applied to every new SQLite connection: WAL lets readers proceed while a
+# write is in flight, and NORMAL sync only fsyncs at checkpoints
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    f"PRAGMA busy_timeout={settings.DB_BUSY_TIMEOUT_MS}",
+)
+
+# Attempts for a write that keeps hitting "database is locked"
+WRITE_ATTEMPTS = 4
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+# Status names stored as their position in these tuples. Codes are persisted,
+# so only ever append new names.
+BOOKING_STATUSES = ('pending', 'confirmed', 'completed', 'cancelled')
+SERVICE_STATUSES = ('requested', 'scheduled', 'in_progress', 'completed', 'cancelled')
+
+class StatusCode(TypeDecorator):
+    """Status name in Python, SMALLINT code in the database"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, names: tuple):
+        super().__init__()
+        self.names = names
+        self._codes = {name: code for code, name in enumerate(names)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"Unknown status {value!r}; expected one of {self.names}")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Tables created before the switch keep TEXT affinity and hand codes
+        # back as strings; unknown legacy names pass through untouched
+        if isinstance(value, str):
+            if not value.isdigit():
+                return value
+            value = int(value)
+        return self.names[value]
+
+def _migrate_status_codes(sync_conn):
+    """Rewrite status names left over from the old String(20) columns as codes"""
+    for table, names in (('bookings', BOOKING_STATUSES), ('service_requests', SERVICE_STATUSES)):
+        cases = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+        placeholders = ", ".join(f"'{name}'" for name in names)
+        sync_conn.exec_driver_sql(
+            f"UPDATE {table} SET status = CASE status {cases} END WHERE status IN ({placeholders})"
+        )
+
 class Customer(Base):
     __tablename__ = 'customers'
 
@@ -36,6 +109,9 @@ class Customer(Base):
     interactions = relationship("Interaction", back_populates="customer", cascade="all, delete-orphan")
     service_requests = relationship("ServiceRequest", back_populates="customer", cascade="all, delete-orphan")
 
+# Column attributes captured by the customer lookup cache; id must stay first
+CUSTOMER_COLUMNS = tuple(column.key for column in Customer.__table__.columns)
+
 class Booking(Base):
     __tablename__ = 'bookings'
 
@@ -44,11 +120,16 @@ class Booking(Base):
     vehicle_model: Mapped[str] = mapped_column(String(100), nullable=False)
     preferred_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     location: Mapped[str] = mapped_column(String(200), nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default='pending')
+    status: Mapped[str] = mapped_column(StatusCode(BOOKING_STATUSES), nullable=False, default='pending')
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationships
-    customer = relationship("Customer", back_populates="bookings")
+    customer = relationship("Customer", back_populates="bookings", lazy="raise")
+
+    # Availability lookups filter on the day and, optionally, the location
+    __table_args__ = (
+        Index('ix_bookings_preferred_date_location', 'preferred_date', 'location'),
+    )
 
 class ServiceRequest(Base):
     __tablename__ = 'service_requests'
@@ -59,12 +140,12 @@ class ServiceRequest(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     preferred_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     vehicle_model: Mapped[str] = mapped_column(String(100), nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default='requested')
+    status: Mapped[str] = mapped_column(StatusCode(SERVICE_STATUSES), nullable=False, default='requested')
     estimated_completion: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationships
-    customer = relationship("Customer", back_populates="service_requests")
+    customer = relationship("Customer", back_populates="service_requests", lazy="raise")
 
 class Interaction(Base):
     __tablename__ = 'interactions'
@@ -78,7 +159,68 @@ class Interaction(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationships
-    customer = relationship("Customer", back_populates="interactions")
+    customer = relationship("Customer", back_populates="interactions", lazy="raise")
+
+    # Recent-history lookups filter on the customer and sort newest first
+    __table_args__ = (
+        Index('ix_interactions_customer_created', 'customer_id', 'created_at'),
+    )
+
+# Per-request SQL statement counter, installed by MonitoringMiddleware when
+# tracking is on (debug or TRACK_QUERY_COUNT) to surface N+1 query patterns
+QUERY_COUNT_ENABLED = settings.DEBUG or settings.TRACK_QUERY_COUNT
+_query_count: ContextVar[Optional[List[int]]] = ContextVar('query_count', default=None)
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+@contextmanager
+def track_queries() -> Iterator[List[int]]:
+    """Count statements executed in this context; read the total from counter[0]"""
+    counter = [0]
+    token = _query_count.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_count.reset(token)
+
+def _is_locked_error(error: Optional[Exception]) -> bool:
+    return isinstance(error, OperationalError) and 'locked' in str(error).lower()
+
+def _retry_on_locked(method):
+    """Retry a write with exponential backoff while SQLite reports the database locked
+    
+    Calls inside a shared transaction (session=...) are not retried; the
+    transaction owner has to roll back and start over.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                return await method(self, *args, **kwargs)
+            except DatabaseError as e:
+                if (attempt == WRITE_ATTEMPTS - 1 or kwargs.get('session') is not None
+                        or not _is_locked_error(e.original_error)):
+                    raise
+                logger.warning(f"Database locked, retrying {method.__name__} (attempt {attempt + 1})")
+                await asyncio.sleep(0.01 * 2 ** attempt)
+    return wrapper
+
+def _create_missing_indexes(sync_conn):
+    """create_all skips existing tables, so add indexes declared after they were made"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+def _with_relationships(stmt, model, include: Optional[Iterable[str]]):
+    """Eager-load the named relationships of model with one SELECT ... IN each"""
+    for name in include or ():
+        if name not in model.__mapper__.relationships:
+            raise ValueError(f"{model.__name__} has no relationship '{name}'")
+        stmt = stmt.options(selectinload(getattr(model, name)))
+    return stmt
 
 class DatabaseService:
     """Database service with SQLite async support"""
@@ -86,6 +228,11 @@ class DatabaseService:
     def __init__(self):
         self._engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker] = None
+        # Created on first use so it binds to the running event loop
+        self._connect_lock: Optional[asyncio.Lock] = None
+        # LRU caches of customer column snapshots: key -> (expires_at, values)
+        self._id_cache: "OrderedDict[int, Tuple[float, tuple]]" = OrderedDict()
+        self._email_cache: "OrderedDict[str, Tuple[float, tuple]]" = OrderedDict()
 
     async def connect(self):
         """Initialize SQLite database connection"""
@@ -95,17 +242,28 @@ class DatabaseService:
             if db_dir and not os.path.exists(db_dir):
                 os.makedirs(db_dir, exist_ok=True)
             
-            # Create async engine
+            # Create async engine with a persistent connection pool shared by
+            # every session, so requests reuse open connections
             self._engine = create_async_engine(
                 f"sqlite+aiosqlite:///{settings.DB_PATH}",
                 echo=settings.DEBUG,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
                 pool_pre_ping=True,
-                pool_recycle=300
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                connect_args={"check_same_thread": False}
             )
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
+            if QUERY_COUNT_ENABLED:
+                event.listen(self._engine.sync_engine, "before_cursor_execute", _count_query)
 
             # Create tables
             async with self._engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(_create_missing_indexes)
+                await conn.run_sync(_migrate_status_codes)
+                journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
 
             # Create session factory
             self._session_factory = async_sessionmaker(
@@ -114,17 +272,26 @@ class DatabaseService:
                 class_=AsyncSession
             )
             
-            logger.info(f"Connected to SQLite database at {settings.DB_PATH}")
+            logger.info(f"Connected to SQLite database at {settings.DB_PATH} (journal_mode={journal_mode})")
             
         except Exception as e:
             logger.error(f"Database connection failed: {str(e)}")
             raise DatabaseError("Failed to connect to database", original_error=e)
 
+    async def ensure_connected(self):
+        """Connect on first use; concurrent first callers share one connect()"""
+        if self._session_factory is not None:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._session_factory is None:
+                await self.connect()
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get a database session"""
-        if self._session_factory is None:
-            await self.connect()
+        await self.ensure_connected()
         
         if self._session_factory is None:
             raise DatabaseError("Session factory not initialized")
@@ -138,16 +305,87 @@ class DatabaseService:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[AsyncConnection, None]:
+        """Borrow a pooled connection for Core-level queries"""
+        await self.ensure_connected()
+        
+        async with self._engine.connect() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[AsyncSession, None]:
+        """Share one session and transaction across several DatabaseService calls
+        
+        Pass the yielded session to methods via session=...; they flush instead
+        of committing and everything is committed once when the block exits.
+        """
+        async with self.session() as session:
+            session.info['transaction'] = True
+            yield session
+            await session.commit()
+
+    @asynccontextmanager
+    async def _scope(self, session: Optional[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
+        """Use the caller's transaction session if given, else a fresh one"""
+        if session is not None:
+            yield session
+        else:
+            async with self.session() as own:
+                yield own
+
+    async def _commit(self, session: AsyncSession):
+        """Commit a method-owned session; leave shared transactions to their owner"""
+        if session.info.get('transaction'):
+            await session.flush()
+        else:
+            await session.commit()
+
     async def close(self):
         """Close database connection"""
         if self._engine:
             await self._engine.dispose()
             logger.info("Disposed SQLite engine")
 
+    # Customer Cache
+    # Entries are immutable tuples of column values and every hit builds its
+    # own detached Customer, so callers can never see each other's changes
+    def _cached_customer(self, cache: OrderedDict, key) -> Optional[Customer]:
+        """Return a fresh Customer for a live cache entry, marking it most recently used"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        customer = Customer(**dict(zip(CUSTOMER_COLUMNS, entry[1])))
+        make_transient_to_detached(customer)
+        return customer
+
+    def _remember_customer(self, customer: Customer):
+        """Cache customer under its id and email, evicting the least recently used"""
+        values = tuple(getattr(customer, column) for column in CUSTOMER_COLUMNS)
+        entry = (time.monotonic() + settings.CUSTOMER_CACHE_TTL, values)
+        for cache, key in ((self._id_cache, customer.id), (self._email_cache, customer.email)):
+            cache[key] = entry
+            cache.move_to_end(key)
+            if len(cache) > settings.CUSTOMER_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def invalidate_customer(self, customer_id: int):
+        """Drop a customer from the lookup caches after it changes"""
+        self._id_cache.pop(customer_id, None)
+        for email in [email for email, (_, values) in self._email_cache.items() if values[0] == customer_id]:
+            del self._email_cache[email]
+
     # Customer Operations
-    async def create_customer(self, customer_data: Dict[str, Any]) -> int:
+    @_retry_on_locked
+    async def create_customer(
+        self, customer_data: Dict[str, Any], session: Optional[AsyncSession] = None
+    ) -> int:
         """Create a new customer record"""
-        async with self.session() as session:
+        async with self._scope(session) as session:
             try:
                 customer = Customer(
                     name=customer_data['name'],
@@ -156,35 +394,67 @@ class DatabaseService:
                     created_at=datetime.utcnow()
                 )
                 session.add(customer)
-                await session.commit()
-                await session.refresh(customer)
-                return customer.id
+                await session.flush()
+                new_id = customer.id
+                await self._commit(session)
+                if not session.info.get('transaction'):
+                    self._remember_customer(customer)
+                return new_id
             except Exception as e:
                 logger.error(f"Failed to create customer: {str(e)}")
                 raise DatabaseError("Failed to create customer", original_error=e)
 
-    async def get_customer(self, customer_id: int) -> Optional[Customer]:
-        """Retrieve customer by ID"""
-        async with self.session() as session:
+    async def get_customer(
+        self, customer_id: int, include: Optional[Set[str]] = None,
+        session: Optional[AsyncSession] = None
+    ) -> Optional[Customer]:
+        """Retrieve customer by ID
+        
+        include names relationships to load up front (e.g. {'bookings',
+        'interactions'}); anything not listed is not available on the result.
+        Plain lookups are served from an in-process cache when possible.
+        """
+        if not include:
+            customer = self._cached_customer(self._id_cache, customer_id)
+            if customer is not None:
+                return customer
+        async with self._scope(session) as session:
             try:
-                stmt = select(Customer).where(Customer.id == customer_id)
+                stmt = _with_relationships(
+                    select(Customer).where(Customer.id == customer_id), Customer, include
+                )
                 result = await session.execute(stmt)
-                return result.scalar_one_or_none()
+                customer = result.scalar_one_or_none()
+                if customer is not None and not include:
+                    self._remember_customer(customer)
+                return customer
             except Exception as e:
                 logger.error(f"Failed to retrieve customer: {str(e)}")
                 raise DatabaseError("Failed to retrieve customer", original_error=e)
 
-    async def get_customer_by_email(self, email: str) -> Optional[Customer]:
-        """Retrieve customer by email"""
+    async def get_customer_by_email(
+        self, email: str, include: Optional[Set[str]] = None
+    ) -> Optional[Customer]:
+        """Retrieve customer by email, eager-loading the relationships in include"""
+        if not include:
+            customer = self._cached_customer(self._email_cache, email)
+            if customer is not None:
+                return customer
         async with self.session() as session:
             try:
-                stmt = select(Customer).where(Customer.email == email)
+                stmt = _with_relationships(
+                    select(Customer).where(Customer.email == email), Customer, include
+                )
                 result = await session.execute(stmt)
-                return result.scalar_one_or_none()
+                customer = result.scalar_one_or_none()
+                if customer is not None and not include:
+                    self._remember_customer(customer)
+                return customer
             except Exception as e:
                 logger.error(f"Failed to retrieve customer by email: {str(e)}")
                 raise DatabaseError("Failed to retrieve customer", original_error=e)
 
+    @_retry_on_locked
     async def update_customer(self, customer_id: int, update_data: Dict[str, Any]) -> bool:
         """Update customer data"""
         async with self.session() as session:
@@ -192,15 +462,24 @@ class DatabaseService:
                 stmt = update(Customer).where(Customer.id == customer_id).values(**update_data)
                 result = await session.execute(stmt)
                 await session.commit()
+                self.invalidate_customer(customer_id)
                 return result.rowcount > 0
             except Exception as e:
                 logger.error(f"Failed to update customer: {str(e)}")
                 raise DatabaseError("Failed to update customer", original_error=e)
 
     # Booking Operations
-    async def create_booking(self, booking_data: Dict[str, Any]) -> int:
-        """Create a new test drive booking"""
-        async with self.session() as session:
+    @_retry_on_locked
+    async def create_booking(
+        self, booking_data: Dict[str, Any], returning: bool = False,
+        session: Optional[AsyncSession] = None
+    ) -> Union[int, Booking]:
+        """Create a new test drive booking
+        
+        Returns the new booking id, or the full Booking row when returning=True
+        so callers do not need a follow-up get_booking query.
+        """
+        async with self._scope(session) as session:
             try:
                 booking = Booking(
                     customer_id=booking_data['customer_id'],
@@ -211,13 +490,34 @@ class DatabaseService:
                     created_at=datetime.utcnow()
                 )
                 session.add(booking)
-                await session.commit()
-                await session.refresh(booking)
-                return booking.id
+                # The flush assigns the primary key; every other column was
+                # set above, so no refresh SELECT is needed after commit
+                await session.flush()
+                new_id = booking.id
+                await self._commit(session)
+                return booking if returning else new_id
             except Exception as e:
                 logger.error(f"Failed to create booking: {str(e)}")
                 raise DatabaseError("Failed to create booking", original_error=e)
 
+    async def create_bookings_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Create many test drive bookings with one executemany round-trip"""
+        if not rows:
+            return []
+        created_at = datetime.utcnow()
+        values = [
+            {
+                'customer_id': row['customer_id'],
+                'vehicle_model': row['vehicle_model'],
+                'preferred_date': row['preferred_date'],
+                'location': row['location'],
+                'status': 'pending',
+                'created_at': created_at
+            }
+            for row in rows
+        ]
+        return await self._insert_many(Booking, values, "bookings")
+
     async def get_booking(self, booking_id: int) -> Optional[Booking]:
         """Get booking by ID"""
         async with self.session() as session:
@@ -229,6 +529,7 @@ class DatabaseService:
                 logger.error(f"Failed to retrieve booking: {str(e)}")
                 raise DatabaseError("Failed to retrieve booking", original_error=e)
 
+    @_retry_on_locked
     async def update_booking_status(self, booking_id: int, status: str) -> bool:
         """Update booking status"""
         async with self.session() as session:
@@ -245,9 +546,11 @@ class DatabaseService:
         """Get all bookings for a specific date and location"""
         async with self.session() as session:
             try:
+                # Half-open [day, next day) range: a plain index range scan
+                day_start = datetime(date.year, date.month, date.day)
                 stmt = select(Booking).where(
-                    Booking.preferred_date >= date.replace(hour=0, minute=0, second=0, microsecond=0),
-                    Booking.preferred_date < date.replace(hour=23, minute=59, second=59, microsecond=999999)
+                    Booking.preferred_date >= day_start,
+                    Booking.preferred_date < day_start + timedelta(days=1)
                 )
                 if location:
                     stmt = stmt.where(Booking.location == location)
@@ -258,31 +561,73 @@ class DatabaseService:
                 logger.error(f"Failed to retrieve bookings: {str(e)}")
                 raise DatabaseError("Failed to retrieve bookings", original_error=e)
 
-    # Service Request Operations
-    async def create_service_request(self, service_data: Dict[str, Any]) -> int:
-        """Create a new service request"""
+    async def get_booked_slots(self, date: datetime, location: Optional[str] = None) -> Set[str]:
+        """Get the distinct booked "HH:MM" slots for a specific date and location"""
         async with self.session() as session:
             try:
-                service = ServiceRequest(
-                    customer_id=service_data['customer_id'],
-                    service_type=service_data['service_type'],
-                    description=service_data['description'],
-                    preferred_date=service_data['preferred_date'],
-                    vehicle_model=service_data['vehicle_model'],
-                    status='requested',
-                    created_at=datetime.utcnow()
+                day_start = datetime(date.year, date.month, date.day)
+                slot = func.strftime('%H:%M', Booking.preferred_date)
+                stmt = select(slot).where(
+                    Booking.preferred_date >= day_start,
+                    Booking.preferred_date < day_start + timedelta(days=1)
                 )
-                session.add(service)
-                await session.commit()
-                await session.refresh(service)
-                return service.id
+                if location:
+                    stmt = stmt.where(Booking.location == location)
+                stmt = stmt.group_by(slot)
+                
+                result = await session.execute(stmt)
+                return set(result.scalars().all())
+            except Exception as e:
+                logger.error(f"Failed to retrieve booked slots: {str(e)}")
+                raise DatabaseError("Failed to retrieve booked slots", original_error=e)
+
+    # Service Request Operations
+    @_retry_on_locked
+    async def create_service_request(
+        self, service_data: Dict[str, Any], session: Optional[AsyncSession] = None
+    ) -> int:
+        """Create a new service request"""
+        async with self._scope(session) as session:
+            try:
+                new_id = await self._insert_one(session, ServiceRequest, {
+                    'customer_id': service_data['customer_id'],
+                    'service_type': service_data['service_type'],
+                    'description': service_data['description'],
+                    'preferred_date': service_data['preferred_date'],
+                    'vehicle_model': service_data['vehicle_model'],
+                    'status': 'requested',
+                    'created_at': datetime.utcnow()
+                })
+                await self._commit(session)
+                return new_id
             except Exception as e:
                 logger.error(f"Failed to create service request: {str(e)}")
                 raise DatabaseError("Failed to create service request", original_error=e)
 
-    async def get_service_request(self, service_id: int) -> Optional[ServiceRequest]:
+    async def create_service_requests_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Create many service requests with one executemany round-trip"""
+        if not rows:
+            return []
+        created_at = datetime.utcnow()
+        values = [
+            {
+                'customer_id': row['customer_id'],
+                'service_type': row['service_type'],
+                'description': row['description'],
+                'preferred_date': row['preferred_date'],
+                'vehicle_model': row['vehicle_model'],
+                'status': 'requested',
+                'created_at': created_at
+            }
+            for row in rows
+        ]
+        return await self._insert_many(ServiceRequest, values, "service requests")
+
+    async def get_service_request(
+        self, service_id: int, session: Optional[AsyncSession] = None
+    ) -> Optional[ServiceRequest]:
         """Get service request by ID"""
-        async with self.session() as session:
+        async with self._scope(session) as session:
             try:
                 stmt = select(ServiceRequest).where(ServiceRequest.id == service_id)
                 result = await session.execute(stmt)
@@ -291,46 +636,92 @@ class DatabaseService:
                 logger.error(f"Failed to retrieve service request: {str(e)}")
                 raise DatabaseError("Failed to retrieve service request", original_error=e)
 
-    async def update_service_status(self, service_id: int, update_data: Dict[str, Any]) -> bool:
-        """Update service request status"""
-        async with self.session() as session:
+    @_retry_on_locked
+    async def update_service_status(
+        self, service_id: int, update_data: Dict[str, Any], returning: bool = False,
+        session: Optional[AsyncSession] = None
+    ) -> Union[bool, Optional[Dict[str, Any]]]:
+        """Update service request status
+        
+        With returning=True the UPDATE hands back the request's customer_id,
+        service_type, vehicle_model and the customer's email in the same
+        statement (None if no row matched), so callers need no extra reads.
+        """
+        async with self._scope(session) as session:
             try:
                 stmt = update(ServiceRequest).where(ServiceRequest.id == service_id).values(**update_data)
-                result = await session.execute(stmt)
-                await session.commit()
-                return result.rowcount > 0
+                if not returning:
+                    result = await session.execute(stmt)
+                    await self._commit(session)
+                    return result.rowcount > 0
+                customer_email = (
+                    select(Customer.email)
+                    .where(Customer.id == ServiceRequest.customer_id)
+                    .scalar_subquery()
+                )
+                result = await session.execute(stmt.returning(
+                    ServiceRequest.customer_id,
+                    ServiceRequest.service_type,
+                    ServiceRequest.vehicle_model,
+                    customer_email.label('customer_email')
+                ))
+                row = result.mappings().one_or_none()
+                await self._commit(session)
+                return dict(row) if row else None
             except Exception as e:
                 logger.error(f"Failed to update service status: {str(e)}")
                 raise DatabaseError("Failed to update service status", original_error=e)
 
     # Interaction Operations
-    async def create_interaction(self, interaction_data: Dict[str, Any]) -> int:
+    @_retry_on_locked
+    async def create_interaction(
+        self, interaction_data: Dict[str, Any], session: Optional[AsyncSession] = None
+    ) -> int:
         """Create a new interaction record"""
-        async with self.session() as session:
+        async with self._scope(session) as session:
             try:
-                interaction = Interaction(
-                    customer_id=interaction_data.get('customer_id'),
-                    type=interaction_data['type'],
-                    content=interaction_data.get('content'),
-                    language=interaction_data.get('language'),
-                    sentiment_score=interaction_data.get('sentiment_score'),
-                    created_at=datetime.utcnow()
-                )
-                session.add(interaction)
-                await session.commit()
-                await session.refresh(interaction)
-                return interaction.id
+                new_id = await self._insert_one(session, Interaction, {
+                    'customer_id': interaction_data.get('customer_id'),
+                    'type': interaction_data['type'],
+                    'content': interaction_data.get('content'),
+                    'language': interaction_data.get('language'),
+                    'sentiment_score': interaction_data.get('sentiment_score'),
+                    'created_at': datetime.utcnow()
+                })
+                await self._commit(session)
+                return new_id
             except Exception as e:
                 logger.error(f"Failed to create interaction: {str(e)}")
                 raise DatabaseError("Failed to create interaction", original_error=e)
 
-    async def get_customer_interactions(self, customer_id: int, limit: int = 10) -> List[Interaction]:
-        """Get recent interactions for a customer"""
+    async def create_interactions_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Create many interaction records with one executemany round-trip"""
+        if not rows:
+            return []
+        created_at = datetime.utcnow()
+        values = [
+            {
+                'customer_id': row.get('customer_id'),
+                'type': row['type'],
+                'content': row.get('content'),
+                'language': row.get('language'),
+                'sentiment_score': row.get('sentiment_score'),
+                'created_at': created_at
+            }
+            for row in rows
+        ]
+        return await self._insert_many(Interaction, values, "interactions")
+
+    async def get_customer_interactions(
+        self, customer_id: int, limit: int = 10, include: Optional[Set[str]] = None
+    ) -> List[Interaction]:
+        """Get recent interactions for a customer, eager-loading the relationships in include"""
         async with self.session() as session:
             try:
                 stmt = select(Interaction).where(
                     Interaction.customer_id == customer_id
                 ).order_by(Interaction.created_at.desc()).limit(limit)
+                stmt = _with_relationships(stmt, Interaction, include)
                 
                 result = await session.execute(stmt)
                 return list(result.scalars().all())
@@ -338,6 +729,27 @@ class DatabaseService:
                 logger.error(f"Failed to retrieve customer interactions: {str(e)}")
                 raise DatabaseError("Failed to retrieve customer interactions", original_error=e)
 
+    # Insert Helpers
+    async def _insert_one(self, session: AsyncSession, model, values: Dict[str, Any]) -> int:
+        """Insert one row with a Core INSERT ... RETURNING id, bypassing the ORM unit of work"""
+        table = model.__table__
+        result = await session.execute(insert(table).values(**values).returning(table.c.id))
+        return result.scalar_one()
+
+    @_retry_on_locked
+    async def _insert_many(self, model, values: List[Dict[str, Any]], label: str) -> List[int]:
+        """Insert rows in a single batched statement and return their ids in order"""
+        async with self.session() as session:
+            try:
+                stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+                result = await session.execute(stmt, values)
+                ids = list(result.scalars().all())
+                await session.commit()
+                return ids
+            except Exception as e:
+                logger.error(f"Failed to bulk create {label}: {str(e)}")
+                raise DatabaseError(f"Failed to bulk create {label}", original_error=e)
+
     # Health Check
     async def health_check(self) -> bool:
         """Check if database is accessible"""
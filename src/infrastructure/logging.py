@@ -3,20 +3,27 @@ Logging configuration for the VoiceBot system.
 Implements structured logging with JSON format and proper log rotation.
 """
 import logging
-import json
+import orjson
 from datetime import datetime
-from typing import Any, Dict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
 from src.core.config import get_settings
 import sys
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
+import queue
 
 settings = get_settings()
 
+# orjson writes naive UTC datetimes as ISO 8601 with a trailing Z
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 class CustomJsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
-            'timestamp': datetime.utcnow().isoformat(),
+            # The record's own creation time; no extra clock read per line
+            'timestamp': datetime.utcfromtimestamp(record.created),
             'level': record.levelname,
             'service': 'voicebot',
             'logger': record.name,
@@ -35,18 +42,28 @@ class CustomJsonFormatter(logging.Formatter):
         if record.exc_info:
             log_record['exception'] = self.formatException(record.exc_info)
             
-        return json.dumps(log_record, default=str)
+        return orjson.dumps(log_record, default=str, option=_ORJSON_OPTIONS).decode()
 
-class CorrelationIdFilter(logging.Filter):
-    """Add correlation ID to log records"""
-    def __init__(self):
-        super().__init__()
-        self.correlation_id = None
+# Correlation ID of the request being handled; each asyncio task sees its own
+correlation_ctx: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+class CorrelationIdFilter(logging.Filter):
+    """Add the current request's correlation ID to log records"""
     def filter(self, record):
-        record.correlation_id = getattr(self, 'correlation_id', None)
+        record.correlation_id = correlation_ctx.get()
         return True
 
+class LogQueueHandler(QueueHandler):
+    """Hand records to the listener thread, keeping exc_info for the JSON formatter"""
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message now, in case its args are mutated before the
+        # listener thread formats it
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+_listener: Optional[QueueListener] = None
+
 def setup_logging() -> logging.Logger:
     """
     Configure logging with JSON formatting and proper handlers
@@ -75,7 +92,6 @@ def setup_logging() -> logging.Logger:
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # File handler with rotation
     file_handler = RotatingFileHandler(
@@ -84,9 +100,27 @@ def setup_logging() -> logging.Logger:
         backupCount=5
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Write from a background thread so logging never blocks the event loop
+    # on console or disk I/O (including rotation)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    log_queue = queue.Queue(-1)
+    logger.addHandler(LogQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(stop_logging)
+
 # Create logger instance
 logger = setup_logging()
@@ -4,12 +4,25 @@ Middleware implementation for request handling, authentication, and monitoring.
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from src.core.config import get_settings
-from src.infrastructure.logging import logger
+from src.infrastructure.logging import logger, correlation_ctx
 from src.domain.exceptions import RateLimitExceededError
+from src.infrastructure.database import QUERY_COUNT_ENABLED, track_queries
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Deque, Dict
+from secrets import token_hex
+import logging
 import time
-import uuid
 from prometheus_client import Counter, Histogram
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
 settings = get_settings()
 
 # Prometheus metrics
@@ -25,63 +38,112 @@ REQUEST_LATENCY = Histogram(
     ['method', 'endpoint']
 )
 
+REQUEST_QUERY_COUNT = Histogram(
+    'voicebot_request_query_count',
+    'SQL statements executed per request',
+    ['endpoint'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50)
+)
+
+# Endpoint label for requests that matched no route, so random URLs cannot
+# create a new metric series each
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+def _endpoint_label(request: Request, status_code: int) -> str:
+    """Label by route template (/booking/status/{booking_id}) rather than the raw URL"""
+    route = request.scope.get('route')
+    if route is not None:
+        return route.path
+    if status_code == 404:
+        return UNMATCHED_ENDPOINT
+    # Mounted apps (static files) have no route template
+    return request.url.path
+
+@lru_cache(maxsize=4096)
+def _request_counter(method: str, endpoint: str, status: int):
+    """Bound REQUEST_COUNT child, so .labels() runs once per label set"""
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+
+@lru_cache(maxsize=4096)
+def _request_latency(method: str, endpoint: str):
+    """Bound REQUEST_LATENCY child, so .labels() runs once per label set"""
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
 class MonitoringMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next) -> Response:
-        # Generate correlation ID
-        correlation_id = str(uuid.uuid4())
+        # Generate correlation ID (32 hex chars straight from os.urandom)
+        correlation_id = token_hex(16)
         request.state.correlation_id = correlation_id
+        correlation_token = correlation_ctx.set(correlation_id)
 
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        try:
-            # Process request
-            response = await call_next(request)
-            
-            # Record metrics
-            REQUEST_COUNT.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status=response.status_code
-            ).inc()
-            
-            REQUEST_LATENCY.labels(
-                method=request.method,
-                endpoint=request.url.path
-            ).observe(time.time() - start_time)
-            
-            # Add correlation ID to response headers
-            response.headers['X-Correlation-ID'] = correlation_id
-            
-            return response
-            
-        except Exception as e:
-            logger.exception(
-                "Request processing failed",
-                extra={
-                    'correlation_id': correlation_id,
-                    'url': str(request.url),
-                    'method': request.method,
-                    'error': str(e)
-                }
-            )
-            raise
+        with track_queries() if QUERY_COUNT_ENABLED else nullcontext() as queries:
+            try:
+                # Process request
+                response = await call_next(request)
+                
+                # Record metrics
+                endpoint = _endpoint_label(request, response.status_code)
+                _request_counter(request.method, endpoint, response.status_code).inc()
+                _request_latency(request.method, endpoint).observe(time.perf_counter() - start_time)
+                
+                # Expose the SQL statement count so tests can assert on it
+                if queries is not None:
+                    request.state.query_count = queries[0]
+                    REQUEST_QUERY_COUNT.labels(endpoint=endpoint).observe(queries[0])
+                    response.headers['X-Query-Count'] = str(queries[0])
+                
+                # Add correlation ID to response headers
+                response.headers['X-Correlation-ID'] = correlation_id
+                
+                return response
+                
+            except Exception as e:
+                # Skip building the extra dict when ERROR records are filtered out
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.exception(
+                        "Request processing failed",
+                        extra={
+                            'correlation_id': correlation_id,
+                            'url': str(request.url),
+                            'method': request.method,
+                            'error': str(e)
+                        }
+                    )
+                raise
+            finally:
+                correlation_ctx.reset(correlation_token)
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
+    # Seconds between sweeps that drop idle clients
+    SWEEP_INTERVAL = 60
+
     def __init__(self, app):
         super().__init__(app)
-        self.requests = {}
+        # Per-IP sliding window of request timestamps, oldest first
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._last_sweep = time.time()
+        # Read once; these are consulted on every request
+        self._period = settings.RATE_LIMIT_PERIOD
+        self._calls = settings.RATE_LIMIT_CALLS
+        # With Redis every worker shares one counter per client; the client
+        # connects lazily on first use
+        self._redis = None
+        if settings.RATE_LIMIT_REDIS_URL:
+            if REDIS_AVAILABLE:
+                self._redis = aioredis.from_url(settings.RATE_LIMIT_REDIS_URL)
+            else:
+                logger.warning("RATE_LIMIT_REDIS_URL is set but redis is not installed; using per-process rate limiting")
 
     async def dispatch(self, request: Request, call_next) -> Response:
         # Get client IP safely
         client_ip = getattr(request.client, 'host', '127.0.0.1') if request.client else '127.0.0.1'
         current_time = time.time()
         
-        # Clean up old requests
-        self.cleanup_old_requests(current_time)
-        
         # Check rate limit
-        if self.is_rate_limited(client_ip, current_time):
+        if await self.check_rate_limit(client_ip, current_time):
             raise RateLimitExceededError()
         
         # Process request
@@ -89,23 +151,44 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return response
 
+    async def check_rate_limit(self, client_ip: str, current_time: float) -> bool:
+        """Check the shared Redis counter if configured, else the in-process window"""
+        if self._redis is not None:
+            try:
+                return await self.is_rate_limited_shared(client_ip, current_time)
+            except Exception as e:
+                logger.warning(f"Redis rate limiting unavailable, using per-process limits: {e}")
+        
+        # Forget idle clients now and then to bound memory
+        if current_time - self._last_sweep >= self.SWEEP_INTERVAL:
+            self.cleanup_old_requests(current_time)
+        return self.is_rate_limited(client_ip, current_time)
+
+    async def is_rate_limited_shared(self, client_ip: str, current_time: float) -> bool:
+        """Fixed-window check with one INCR per request, shared by all workers"""
+        period = self._period
+        key = f"rl:{client_ip}:{int(current_time // period)}"
+        count = await self._redis.incr(key)
+        if count == 1:
+            await self._redis.expire(key, period)
+        return count > self._calls
+
     def cleanup_old_requests(self, current_time: float):
-        """Remove requests older than the rate limit period"""
-        cutoff = current_time - settings.RATE_LIMIT_PERIOD
+        """Drop clients whose every request is older than the rate limit period"""
+        cutoff = current_time - self._period
+        self._last_sweep = current_time
         
-        for ip in list(self.requests.keys()):
-            self.requests[ip] = [
-                timestamp for timestamp in self.requests[ip]
-                if timestamp > cutoff
-            ]
-            if not self.requests[ip]:
-                del self.requests[ip]
+        for ip in [ip for ip, window in self.requests.items() if not window or window[-1] <= cutoff]:
+            del self.requests[ip]
 
     def is_rate_limited(self, client_ip: str, current_time: float) -> bool:
         """Check if client has exceeded rate limit"""
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
+        window = self.requests[client_ip]
+        cutoff = current_time - self._period
         
-        self.requests[client_ip].append(current_time)
+        # Expire this client's old timestamps; amortized O(1) per request
+        while window and window[0] <= cutoff:
+            window.popleft()
+        window.append(current_time)
         
-        return len(self.requests[client_ip]) > settings.RATE_LIMIT_CALLS
+        return len(window) > self._calls
@@ -0,0 +1,77 @@
+"""
+In-memory static file table for the frontend.
+Files are read, hashed and gzip-compressed once at startup, so serving one is a
+dict lookup plus an Accept-Encoding check with no filesystem access.
+"""
+from fastapi import Request, Response
+from pathlib import Path
+from typing import Dict, Optional
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+
+logger = logging.getLogger(__name__)
+
+# Compressing tiny files or already-compressed formats gains nothing
+MIN_COMPRESS_SIZE = 500
+COMPRESSIBLE_PREFIXES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+# Names carrying a content hash (app.3f9a1c2e.js) never change, so they can be
+# cached forever; everything else must be revalidated with its ETag
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.")
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+class StaticAsset:
+    """One file's bytes, precompressed variant and response headers"""
+    __slots__ = ("body", "gzip_body", "media_type", "headers")
+
+    def __init__(self, name: str, body: bytes):
+        self.body = body
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.gzip_body: Optional[bytes] = None
+        if len(body) >= MIN_COMPRESS_SIZE and self.media_type.startswith(COMPRESSIBLE_PREFIXES):
+            compressed = gzip.compress(body, 9)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+        self.headers = {
+            "ETag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            "Cache-Control": IMMUTABLE_CACHE if HASHED_NAME.search(name) else REVALIDATE_CACHE,
+            "Vary": "Accept-Encoding",
+        }
+
+class StaticAssets:
+    """Precomputed responses for every file under a directory"""
+
+    def __init__(self):
+        self.files: Dict[str, StaticAsset] = {}
+
+    def load(self, directory: Path):
+        """Read every file below directory, keyed by its relative URL path"""
+        files = {}
+        for path in directory.rglob("*"):
+            if path.is_file():
+                name = path.relative_to(directory).as_posix()
+                files[name] = StaticAsset(name, path.read_bytes())
+        self.files = files
+        logger.info(f"Loaded {len(files)} static files from {directory}")
+
+    def response(self, path: str, request: Request) -> Response:
+        """Serve path, honouring If-None-Match and gzip Accept-Encoding"""
+        asset = self.files.get(path)
+        if asset is None:
+            return Response(status_code=404)
+        if asset.headers["ETag"] in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=asset.headers)
+        if asset.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                content=asset.gzip_body,
+                media_type=asset.media_type,
+                headers={**asset.headers, "Content-Encoding": "gzip"}
+            )
+        return Response(content=asset.body, media_type=asset.media_type, headers=asset.headers)
+
+# Create singleton instance
+static_assets = StaticAssets()
@@ -5,68 +5,363 @@ Optimized for Vercel serverless deployment while preserving project structure.
 """
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
-import os
-import json
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+import hashlib
+import orjson
+import re
+import time
 from pathlib import Path
 from functools import lru_cache
 import asyncio
 
-# Import your modules with error handling for Vercel deployment
-try:
-    from src.api import voice_routes, booking_routes, service_routes
-    ROUTES_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Could not import routes: {e}")
-    ROUTES_AVAILABLE = False
-
-try:
-    from src.core.config import get_settings
-    settings = get_settings()
-    CONFIG_AVAILABLE = True
-except ImportError:
-    # Fallback settings for Vercel deployment
-    class FallbackSettings:
-        PROJECT_NAME = "AI Sales Assistant Chatbot"
-        API_VERSION = "v1"
-        ALLOWED_HOSTS = ["*"]
-        DEBUG = False
-        HOST = "0.0.0.0"
-        PORT = 8000
-        LOG_LEVEL = "INFO"
-        ENABLE_METRICS = False
-        PROMETHEUS_PORT = 8001
-    
-    settings = FallbackSettings()
-    CONFIG_AVAILABLE = False
-
-try:
-    from src.infrastructure.database import db_service
-    DB_AVAILABLE = True
-except ImportError:
-    DB_AVAILABLE = False
-
-try:
-    from src.infrastructure.middleware import MonitoringMiddleware, RateLimitMiddleware
-    MIDDLEWARE_AVAILABLE = True
-except ImportError:
-    MIDDLEWARE_AVAILABLE = False
-
-try:
-    from src.infrastructure.logging import logger
-    LOGGING_AVAILABLE = True
-except ImportError:
-    import logging
-    logger = logging.getLogger(__name__)
-    LOGGING_AVAILABLE = False
-
-# Remove Prometheus import for serverless
-try:
-    from prometheus_client import start_http_server
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
+from src.infrastructure.static_assets import static_assets
+
+from src._bootstrap import (
+    IS_SERVERLESS,
+    ROUTES_AVAILABLE, voice_routes, booking_routes, service_routes,
+    CONFIG_AVAILABLE, settings, ensure_dirs,
+    DB_AVAILABLE, db_service, interaction_batcher,
+    VoiceBotException,
+    NOTIFICATIONS_AVAILABLE, notification_queue,
+    MIDDLEWARE_AVAILABLE, MonitoringMiddleware, RateLimitMiddleware,
+    logger,
+    PROMETHEUS_AVAILABLE, start_http_server,
+)
+
+# The frontend ships with the code, so whether it exists is fixed at import
+FRONTEND_DIR = (Path(__file__).parent.parent / "frontend").resolve()
+FRONTEND_EXISTS = FRONTEND_DIR.is_dir()
+
+# Seconds browsers may reuse a CORS preflight answer (Chrome caps this at 2 hours)
+CORS_PREFLIGHT_MAX_AGE = 86400
+
+# Chat keyword categories in priority order: the first category with a keyword
+# anywhere in the (lowercased) message picks the response
+CHAT_CATEGORIES = (
+    ("greeting", ('hello', 'hi', 'hey', 'namaste', 'good morning', 'good afternoon')),
+    ("vehicles", ('bike', 'motorcycle', 'scooter', 'vehicle', 'models')),
+    ("test_ride", ('test ride', 'book', 'appointment', 'schedule', 'try')),
+    ("emi", ('emi', 'finance', 'loan', 'payment', 'installment')),
+    ("service", ('service', 'maintenance', 'repair', 'servicing')),
+    ("pricing", ('price', 'cost', 'rate', 'amount', 'money')),
+    ("mileage", ('mileage', 'fuel', 'efficiency', 'kmpl')),
+)
+# Narrows a vehicle question down to the budget answer
+BUDGET_KEYWORDS = ('under', 'below', '1 lakh', 'budget', 'cheap', 'affordable')
+
+CHAT_RESPONSES = {
+    "greeting": "👋 Welcome to VoiceBot Enterprise! I'm your AI sales assistant for two-wheelers. I can help with bike selection, pricing, test rides, EMI options, and service bookings. How can I assist you today?",
+    "vehicles_budget": "🏍️ Great bikes under ₹1 lakh: Honda CB Shine (₹72,000) - 65 kmpl, Bajaj Pulsar 125 (₹94,000) - sporty design, TVS Raider 125 (₹85,000) - modern features. All come with 5-year warranty. Which style interests you - commuter or sporty?",
+    "vehicles": "🏍️ Our popular models: Entry level: Honda Shine, Hero Splendor+ | Premium: Bajaj Pulsar, TVS Apache | Scooters: Honda Activa, TVS Jupiter. Which category would you like to explore?",
+    "test_ride": "📅 I'd love to arrange a test ride! Please share: 1) Your name 2) Mobile number 3) Preferred model 4) Convenient date/time. We're open Mon-Sat, 10 AM-6 PM. Which bike caught your interest?",
+    "emi": "💳 Flexible EMI options available! Starting from ₹2,500/month. For ₹1L bike: ₹3,000/month (36 months). We partner with all major banks - HDFC, ICICI, SBI. Special rates for salaried professionals. Need exact calculation for a specific model?",
+    "service": "🔧 Service packages: Basic Service (₹800) - Oil change, basic check | Complete Service (₹1,500) - 15-point inspection | Premium Service (₹2,500) - Full diagnostic. First service FREE for new bikes! When was your last service?",
+    "pricing": "💰 Our transparent pricing: Entry bikes: ₹55,000-75,000 | Premium bikes: ₹85,000-1.5L | Sports bikes: ₹1.2L+ | Scooters: ₹65,000-95,000. Current offers: Up to ₹15,000 discount + free accessories. Which segment interests you?",
+    "mileage": "⛽ Excellent mileage options: Honda Shine - 65 kmpl | Hero Splendor+ - 70 kmpl | TVS Star City - 68 kmpl | Honda Activa - 60 kmpl. All certified ARAI figures. Looking for maximum fuel efficiency?",
+    "default": "🤖 Thank you for your interest! I can help with: 🏍️ Bike information & pricing | 📅 Test ride bookings | 💳 EMI calculations | 🔧 Service packages | ⛽ Mileage info. What would you like to know?",
+}
+
+def _keyword_pattern(keyword: str) -> str:
+    """Whole-word pattern for a keyword; words of three or more letters and
+    phrases also match their plural ("bike" matches "bikes")"""
+    plural = "s?" if " " in keyword or len(keyword) >= 3 else ""
+    return rf"\b{re.escape(keyword)}{plural}\b"
+
+# One compiled alternation with a named group per category (plus the budget
+# qualifier) finds every keyword in a single scan. Matching whole words means
+# "hi" no longer fires on "this" or "emi" on "premium"
+CLASSIFIER = re.compile("|".join(
+    f"(?P<{category}>" + "|".join(map(_keyword_pattern, keywords)) + ")"
+    for category, keywords in CHAT_CATEGORIES + (("budget", BUDGET_KEYWORDS),)
+))
+
+def classify_message(msg: str) -> str:
+    """Return the CHAT_RESPONSES key for a lowercased message"""
+    # The earliest match in the text isn't the highest-priority category, so
+    # collect every matched group and walk CHAT_CATEGORIES in order
+    found = {match.lastgroup for match in CLASSIFIER.finditer(msg)}
+    for category, _ in CHAT_CATEGORIES:
+        if category in found:
+            if category == "vehicles" and "budget" in found:
+                return "vehicles_budget"
+            return category
+    return "default"
+
+# Only short messages are memoized: the repeated prompts worth caching ("hi",
+# "price", "emi") are short, and capping the key size stops unique large
+# bodies from pinning megabytes in the cache
+CACHED_MESSAGE_LENGTH = 256
+
+@lru_cache(maxsize=2048)
+def _category_for(msg: str) -> str:
+    return classify_message(msg)
+
+def _message_category(message: str) -> str:
+    """CHAT_RESPONSES key for a raw message; repeated short prompts are
+    answered from a cache keyed on the normalized message"""
+    msg = " ".join(message.lower().split())
+    if len(msg) > CACHED_MESSAGE_LENGTH:
+        return classify_message(msg)
+    return _category_for(msg)
+
+def get_enhanced_response(message: str, language: str = "en") -> str:
+    """Enhanced demo responses with more comprehensive coverage"""
+    return CHAT_RESPONSES[_message_category(message)]
+
+def _chat_envelope(text: str, language) -> bytes:
+    return orjson.dumps({"response": text, "status": "success", "language": language})
+
+# Complete /chat response bodies for every known language and category, so a
+# reply is a dict lookup; other languages are serialized per request
+CHAT_LANGUAGES = ("en",) + tuple(getattr(settings, "SUPPORTED_LANGUAGES", ()))
+PRESERIALIZED = {
+    language: {category: _chat_envelope(text, language) for category, text in CHAT_RESPONSES.items()}
+    for language in CHAT_LANGUAGES
+}
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+# ETags for the preserialized bodies, indexed like PRESERIALIZED
+PRESERIALIZED_ETAGS = {
+    language: {category: _etag(body) for category, body in bodies.items()}
+    for language, bodies in PRESERIALIZED.items()
+}
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Whether an If-None-Match header lists etag (or is "*")"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate == etag or candidate == "W/" + etag:
+            return True
+    return False
+
+async def voicebot_exception_handler(request: Request, exc: VoiceBotException):
+    """Domain errors the routes don't translate themselves map to their own status code"""
+    return ORJSONResponse({"detail": exc.message}, status_code=exc.status_code)
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Single logging path for anything unexpected"""
+    logger.error(f"Unhandled error on {request.method} {request.url.path}: {type(exc).__name__}")
+    return ORJSONResponse({"detail": "Internal server error"}, status_code=500)
+
+async def _json(request: Request):
+    """Request body parsed with orjson rather than Starlette's stdlib json path"""
+    try:
+        return orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON format")
+
+# Enhanced chat endpoint for the frontend
+async def chat_endpoint(request: Request):
+    """Enhanced chat endpoint for frontend with proper JSON handling"""
+    try:
+        # Handle JSON request properly
+        body = await _json(request)
+        message = body.get("message", "")
+        language = body.get("language", "en")
+
+        if not message:
+            raise HTTPException(status_code=400, detail="Message is required")
+
+        # Enhanced response logic
+        category = _message_category(message)
+        envelopes = PRESERIALIZED.get(language) if isinstance(language, str) else None
+        if envelopes is not None:
+            content = envelopes[category]
+            etag = PRESERIALIZED_ETAGS[language][category]
+        else:
+            content = _chat_envelope(CHAT_RESPONSES[category], language)
+            etag = _etag(content)
+
+        # Replies are deterministic, so a client repeating a prompt with the
+        # ETag it was given gets an empty 304
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Chat endpoint error: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": "Internal server error",
+                "message": "Please try again later"
+            }
+        )
+
+# Additional API endpoints for better functionality
+VEHICLES = [
+    {"id": 1, "name": "Honda CB Shine", "price": 72000, "mileage": "65 kmpl", "engine": "124cc", "type": "Commuter"},
+    {"id": 2, "name": "Bajaj Pulsar 125", "price": 94000, "mileage": "50 kmpl", "engine": "124cc", "type": "Sports"},
+    {"id": 3, "name": "TVS Raider 125", "price": 85000, "mileage": "67 kmpl", "engine": "124cc", "type": "Premium"},
+    {"id": 4, "name": "Honda Activa 6G", "price": 75000, "mileage": "60 kmpl", "engine": "109cc", "type": "Scooter"},
+    {"id": 5, "name": "Hero Splendor Plus", "price": 68000, "mileage": "70 kmpl", "engine": "97cc", "type": "Economy"}
+]
+
+# The catalogue never changes at runtime, so serialize it once
+VEHICLES_JSON = orjson.dumps({"vehicles": VEHICLES, "count": len(VEHICLES)})
+
+async def get_vehicles():
+    """Get available vehicle models"""
+    return Response(content=VEHICLES_JSON, media_type="application/json")
+
+async def book_test_ride(request: Request):
+    """Book a test ride"""
+    try:
+        booking_data = await _json(request)
+        required_fields = ["name", "phone", "model"]
+
+        for field in required_fields:
+            if field not in booking_data:
+                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+
+        return {
+            "message": "Test ride booked successfully!",
+            "booking_id": f"TR{booking_data['phone'][-4:]}",
+            "details": booking_data,
+            "status": "confirmed"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Booking error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Booking failed")
+
+# Startup and shutdown events (modified for serverless compatibility)
+async def _connect_db():
+    await db_service.ensure_connected()
+    await interaction_batcher.start()
+
+async def _start_metrics():
+    try:
+        start_http_server(settings.PROMETHEUS_PORT)
+        logger.info(f"Metrics server started on port {settings.PROMETHEUS_PORT}")
+    except OSError:
+        # With several workers only the first one can bind the port
+        logger.info(f"Metrics port {settings.PROMETHEUS_PORT} already served by another worker")
+
+async def startup_event():
+    """
+    Initialize services on application startup (serverless-compatible)
+    """
+    try:
+        # Create storage directories once per process (not writable in serverless)
+        if CONFIG_AVAILABLE and not IS_SERVERLESS:
+            ensure_dirs(settings)
+
+        # Background workers that send queued email notifications
+        if NOTIFICATIONS_AVAILABLE:
+            await notification_queue.start()
+
+        # In serverless the database connects lazily on the first request that
+        # uses it (db_service.ensure_connected), so cold starts don't pay for it
+        if not IS_SERVERLESS:
+            tasks = []
+            if DB_AVAILABLE:
+                tasks.append(_connect_db())
+            if PROMETHEUS_AVAILABLE and settings.ENABLE_METRICS:
+                tasks.append(_start_metrics())
+            await asyncio.gather(*tasks)
+
+        logger.info("Application startup completed")
+    except Exception as e:
+        logger.error(f"Application startup failed: {str(e)}")
+        # Don't raise in serverless environment to prevent deployment failure
+        if not IS_SERVERLESS:
+            raise
+
+async def shutdown_event():
+    """
+    Cleanup services on application shutdown (serverless-compatible)
+    """
+    try:
+        # Flush pending notifications before the workers are cancelled
+        if NOTIFICATIONS_AVAILABLE:
+            await notification_queue.stop()
+
+        # Close database connection only if available and not in serverless,
+        # after writing any batched interactions
+        if DB_AVAILABLE and not IS_SERVERLESS:
+            await interaction_batcher.stop()
+            await db_service.close()
+        logger.info("Application shutdown completed")
+    except Exception as e:
+        logger.error(f"Application shutdown failed: {str(e)}")
+        # Don't raise in serverless environment
+
+async def serve_static(path: str, request: Request):
+    """Frontend assets, precompressed and hashed at startup"""
+    return static_assets.response(path, request)
+
+async def root(request: Request):
+    """Enhanced root endpoint"""
+    # index.html is held in memory with the other frontend files (see create_app)
+    if "index.html" in static_assets.files:
+        return static_assets.response("index.html", request)
+
+    return {
+        "message": "AI Sales Assistant Chatbot API",
+        "version": settings.API_VERSION,
+        "status": "running",
+        "endpoints": {
+            "chat": "/api/chat/send",
+            "vehicles": "/api/vehicles",
+            "booking": "/api/booking/test-ride",
+            "health": "/health",
+            "docs": "/api/docs"
+        }
+    }
+
+# Load-balancer probes reuse the last result for a few seconds instead of
+# each taking a database connection; the body is serialized once per probe.
+# Only bytes are cached: middleware may edit a Response's headers in place
+HEALTH_TTL = 5.0
+_HEALTH = {"ts": 0.0, "body": None}
+
+def _health_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+async def health_check():
+    """
+    Health check endpoint for monitoring (serverless-compatible)
+    """
+    now = time.monotonic()
+    if _HEALTH["body"] is not None and now - _HEALTH["ts"] < HEALTH_TTL:
+        return _health_response(_HEALTH["body"])
+    try:
+        health_status = {
+            "status": "healthy",
+            "services": {
+                "api": "up",
+                "database": "not configured" if not DB_AVAILABLE else "up"
+            },
+            "environment": "serverless" if IS_SERVERLESS else "standard"
+        }
+
+        # Check database only if available and not in serverless
+        if DB_AVAILABLE and not IS_SERVERLESS:
+            try:
+                db_health = await db_service.health_check()
+                health_status["services"]["database"] = "up" if db_health else "down"
+            except Exception as e:
+                health_status["services"]["database"] = f"error: {str(e)}"
+
+        _HEALTH["body"] = orjson.dumps(health_status)
+        _HEALTH["ts"] = now
+        return _health_response(_HEALTH["body"])
+    except Exception as e:
+        logger.error(f"Health check failed: {str(e)}")
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "unhealthy",
+                "error": str(e),
+                "services": {"api": "up", "database": "unknown"}
+            }
+        )
 
 def create_app() -> FastAPI:
     """
@@ -78,7 +373,9 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
-        openapi_url="/api/openapi.json"
+        openapi_url="/api/openapi.json",
+        # orjson handles the large voice payloads much faster than stdlib json
+        default_response_class=ORJSONResponse
     )
 
     # Add middleware with error handling
@@ -87,17 +384,27 @@ def create_app() -> FastAPI:
             app.add_middleware(MonitoringMiddleware)
             app.add_middleware(RateLimitMiddleware)
         except Exception as e:
-            if logger:
-                logger.warning(f"Could not add custom middleware: {e}")
+            logger.warning(f"Could not add custom middleware: {e}")
     
+    # Starlette's CORS middleware is plain ASGI and passes requests without an
+    # Origin straight through; the expensive part is the browser's preflight
+    # round-trip, so let clients cache preflight results for a day
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOWED_HOSTS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=CORS_PREFLIGHT_MAX_AGE,
     )
 
+    # Domain errors the routes don't translate themselves map to their own status code
+    if VoiceBotException is not None:
+        app.add_exception_handler(VoiceBotException, voicebot_exception_handler)
+
+    # Single logging path for anything unexpected
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
     # Include routers with versioning (only if available)
     if ROUTES_AVAILABLE:
         try:
@@ -117,256 +424,95 @@ def create_app() -> FastAPI:
                 tags=["service"]
             )
         except Exception as e:
-            if logger:
-                logger.warning(f"Could not include routers: {e}")
+            logger.warning(f"Could not include routers: {e}")
 
-    # Mount static files for frontend (with error handling)
+    # Serve frontend static files from memory (with error handling)
     try:
-        frontend_path = Path(__file__).parent.parent / "frontend"
-        if frontend_path.exists():
-            app.mount("/static", StaticFiles(directory=str(frontend_path)), name="static")
-            if logger:
-                logger.info(f"Mounted static files from: {frontend_path}")
+        if FRONTEND_EXISTS:
+            static_assets.load(FRONTEND_DIR)
+            app.add_api_route("/static/{path:path}", serve_static, methods=["GET", "HEAD"])
+            logger.info(f"Serving static files from: {FRONTEND_DIR}")
     except Exception as e:
-        if logger:
-            logger.warning(f"Could not mount static files: {e}")
-
-    # Enhanced chat endpoint for the frontend
-    @app.post("/chat")
-    @app.post("/api/chat/send")
-    async def chat_endpoint(request: Request):
-        """Enhanced chat endpoint for frontend with proper JSON handling"""
-        try:
-            # Handle JSON request properly
-            body = await request.json()
-            message = body.get("message", "")
-            language = body.get("language", "en")
-            
-            if not message:
-                raise HTTPException(status_code=400, detail="Message is required")
-            
-            # Enhanced response logic
-            response = get_enhanced_response(message, language)
-            return {
-                "response": response,
-                "status": "success",
-                "language": language
-            }
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON format")
-        except Exception as e:
-            if logger:
-                logger.error(f"Chat endpoint error: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Internal server error",
-                    "message": "Please try again later"
-                }
-            )
+        logger.warning(f"Could not load static files: {e}")
 
-    def get_enhanced_response(message: str, language: str = "en") -> str:
-        """Enhanced demo responses with more comprehensive coverage"""
-        msg = message.lower()
-        
-        # Greetings
-        if any(word in msg for word in ['hello', 'hi', 'hey', 'namaste', 'good morning', 'good afternoon']):
-            return "👋 Welcome to VoiceBot Enterprise! I'm your AI sales assistant for two-wheelers. I can help with bike selection, pricing, test rides, EMI options, and service bookings. How can I assist you today?"
-        
-        # Bike/Vehicle queries
-        elif any(word in msg for word in ['bike', 'motorcycle', 'scooter', 'vehicle', 'models']):
-            if any(word in msg for word in ['under', 'below', '1 lakh', 'budget', 'cheap', 'affordable']):
-                return "🏍️ Great bikes under ₹1 lakh: Honda CB Shine (₹72,000) - 65 kmpl, Bajaj Pulsar 125 (₹94,000) - sporty design, TVS Raider 125 (₹85,000) - modern features. All come with 5-year warranty. Which style interests you - commuter or sporty?"
-            else:
-                return "🏍️ Our popular models: Entry level: Honda Shine, Hero Splendor+ | Premium: Bajaj Pulsar, TVS Apache | Scooters: Honda Activa, TVS Jupiter. Which category would you like to explore?"
-        
-        # Test ride booking
-        elif any(word in msg for word in ['test ride', 'book', 'appointment', 'schedule', 'try']):
-            return "📅 I'd love to arrange a test ride! Please share: 1) Your name 2) Mobile number 3) Preferred model 4) Convenient date/time. We're open Mon-Sat, 10 AM-6 PM. Which bike caught your interest?"
-        
-        # EMI and financing
-        elif any(word in msg for word in ['emi', 'finance', 'loan', 'payment', 'installment']):
-            return "💳 Flexible EMI options available! Starting from ₹2,500/month. For ₹1L bike: ₹3,000/month (36 months). We partner with all major banks - HDFC, ICICI, SBI. Special rates for salaried professionals. Need exact calculation for a specific model?"
-        
-        # Service and maintenance
-        elif any(word in msg for word in ['service', 'maintenance', 'repair', 'servicing']):
-            return "🔧 Service packages: Basic Service (₹800) - Oil change, basic check | Complete Service (₹1,500) - 15-point inspection | Premium Service (₹2,500) - Full diagnostic. First service FREE for new bikes! When was your last service?"
-        
-        # Pricing queries
-        elif any(word in msg for word in ['price', 'cost', 'rate', 'amount', 'money']):
-            return "💰 Our transparent pricing: Entry bikes: ₹55,000-75,000 | Premium bikes: ₹85,000-1.5L | Sports bikes: ₹1.2L+ | Scooters: ₹65,000-95,000. Current offers: Up to ₹15,000 discount + free accessories. Which segment interests you?"
-        
-        # Mileage queries
-        elif any(word in msg for word in ['mileage', 'fuel', 'efficiency', 'kmpl']):
-            return "⛽ Excellent mileage options: Honda Shine - 65 kmpl | Hero Splendor+ - 70 kmpl | TVS Star City - 68 kmpl | Honda Activa - 60 kmpl. All certified ARAI figures. Looking for maximum fuel efficiency?"
-        
-        # Default response
-        else:
-            return "🤖 Thank you for your interest! I can help with: 🏍️ Bike information & pricing | 📅 Test ride bookings | 💳 EMI calculations | 🔧 Service packages | ⛽ Mileage info. What would you like to know?"
-
-    # Additional API endpoints for better functionality
-    @app.get("/api/vehicles")
-    async def get_vehicles():
-        """Get available vehicle models"""
-        vehicles = [
-            {"id": 1, "name": "Honda CB Shine", "price": 72000, "mileage": "65 kmpl", "engine": "124cc", "type": "Commuter"},
-            {"id": 2, "name": "Bajaj Pulsar 125", "price": 94000, "mileage": "50 kmpl", "engine": "124cc", "type": "Sports"},
-            {"id": 3, "name": "TVS Raider 125", "price": 85000, "mileage": "67 kmpl", "engine": "124cc", "type": "Premium"},
-            {"id": 4, "name": "Honda Activa 6G", "price": 75000, "mileage": "60 kmpl", "engine": "109cc", "type": "Scooter"},
-            {"id": 5, "name": "Hero Splendor Plus", "price": 68000, "mileage": "70 kmpl", "engine": "97cc", "type": "Economy"}
-        ]
-        return {"vehicles": vehicles, "count": len(vehicles)}
-
-    @app.post("/api/booking/test-ride")
-    async def book_test_ride(request: Request):
-        """Book a test ride"""
-        try:
-            booking_data = await request.json()
-            required_fields = ["name", "phone", "model"]
-            
-            for field in required_fields:
-                if field not in booking_data:
-                    raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
-            
-            return {
-                "message": "Test ride booked successfully!",
-                "booking_id": f"TR{booking_data['phone'][-4:]}",
-                "details": booking_data,
-                "status": "confirmed"
-            }
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON format")
-        except Exception as e:
-            if logger:
-                logger.error(f"Booking error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Booking failed")
-
-    # Startup and shutdown events (modified for serverless compatibility)
-    @app.on_event("startup")
-    async def startup_event():
-        """
-        Initialize services on application startup (serverless-compatible)
-        """
-        try:
-            # Initialize database connection only if available and not in serverless
-            if DB_AVAILABLE and not os.getenv('VERCEL'):
-                await db_service.connect()
-            
-            # Skip Prometheus in serverless environment
-            if PROMETHEUS_AVAILABLE and settings.ENABLE_METRICS and not os.getenv('VERCEL'):
-                start_http_server(settings.PROMETHEUS_PORT)
-                if logger:
-                    logger.info(f"Metrics server started on port {settings.PROMETHEUS_PORT}")
-                
-            if logger:
-                logger.info("Application startup completed")
-        except Exception as e:
-            if logger:
-                logger.error(f"Application startup failed: {str(e)}")
-            # Don't raise in serverless environment to prevent deployment failure
-            if not os.getenv('VERCEL'):
-                raise
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """
-        Cleanup services on application shutdown (serverless-compatible)
-        """
-        try:
-            # Close database connection only if available and not in serverless
-            if DB_AVAILABLE and not os.getenv('VERCEL'):
-                await db_service.close()
-            if logger:
-                logger.info("Application shutdown completed")
-        except Exception as e:
-            if logger:
-                logger.error(f"Application shutdown failed: {str(e)}")
-            # Don't raise in serverless environment
-
-    @app.get("/")
-    async def root():
-        """Enhanced root endpoint"""
-        try:
-            frontend_path = Path(__file__).parent.parent / "frontend" / "index.html"
-            if frontend_path.exists():
-                return FileResponse(str(frontend_path))
-        except Exception:
-            pass
-        
-        return {
-            "message": "AI Sales Assistant Chatbot API",
-            "version": settings.API_VERSION,
-            "status": "running",
-            "endpoints": {
-                "chat": "/api/chat/send",
-                "vehicles": "/api/vehicles",
-                "booking": "/api/booking/test-ride",
-                "health": "/health",
-                "docs": "/api/docs"
-            }
-        }
-
-    @app.get("/health")
-    async def health_check():
-        """
-        Health check endpoint for monitoring (serverless-compatible)
-        """
-        try:
-            health_status = {
-                "status": "healthy",
-                "services": {
-                    "api": "up",
-                    "database": "not configured" if not DB_AVAILABLE else "up"
-                },
-                "environment": "serverless" if os.getenv('VERCEL') else "standard"
-            }
-            
-            # Check database only if available and not in serverless
-            if DB_AVAILABLE and not os.getenv('VERCEL'):
-                try:
-                    db_health = await db_service.health_check()
-                    health_status["services"]["database"] = "up" if db_health else "down"
-                except Exception as e:
-                    health_status["services"]["database"] = f"error: {str(e)}"
-            
-            return health_status
-        except Exception as e:
-            if logger:
-                logger.error(f"Health check failed: {str(e)}")
-            return JSONResponse(
-                status_code=503,
-                content={
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "services": {"api": "up", "database": "unknown"}
-                }
-            )
+    # Frontend chat, demo API and lifecycle handlers
+    app.add_api_route("/chat", chat_endpoint, methods=["POST"])
+    app.add_api_route("/api/chat/send", chat_endpoint, methods=["POST"])
+    app.add_api_route("/api/vehicles", get_vehicles, methods=["GET"])
+    app.add_api_route("/api/booking/test-ride", book_test_ride, methods=["POST"])
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+    app.add_event_handler("startup", startup_event)
+    app.add_event_handler("shutdown", shutdown_event)
 
     return app
 
 # Create the app instance
 app = create_app()
 
+# Probes and static files need neither rate limiting, metrics nor routing
+BYPASS_METHODS = ("GET", "HEAD")
+
+async def _health_asgi(scope, receive, send):
+    result = await health_check()
+    response = result if isinstance(result, Response) else ORJSONResponse(result)
+    await response(scope, receive, send)
+
+async def _static_asgi(scope, receive, send, path: str):
+    await static_assets.response(path, Request(scope, receive))(scope, receive, send)
+
+async def asgi_app(scope, receive, send):
+    """
+    Outer ASGI entry point: answers /health, /static/* and /favicon.ico
+    directly and hands everything else (including lifespan) to the app
+    """
+    if scope["type"] == "http" and scope["method"] in BYPASS_METHODS:
+        path = scope["path"]
+        if path == "/health":
+            return await _health_asgi(scope, receive, send)
+        if static_assets.files:
+            if path.startswith("/static/"):
+                return await _static_asgi(scope, receive, send, path[len("/static/"):])
+            if path == "/favicon.ico" and "favicon.ico" in static_assets.files:
+                return await _static_asgi(scope, receive, send, "favicon.ico")
+    await app(scope, receive, send)
+
 # For Vercel serverless deployment
-handler = app
+handler = asgi_app
 
-# Development server (only runs locally, not on Vercel)
+# Local server (not used on Vercel). handler is served so /health and /static
+# keep their middleware bypass; run from the project root
 if __name__ == "__main__":
+    import os
     import uvicorn
-    try:
+
+    if settings.DEBUG:
+        # Auto-reload only works with a single process
         uvicorn.run(
-            "main:app",
+            "src.main:handler",
             host=settings.HOST,
             port=settings.PORT,
-            reload=settings.DEBUG,
-            workers=4,
+            reload=True,
             log_level=settings.LOG_LEVEL.lower()
         )
-    except Exception as e:
-        # Fallback for missing settings
-        uvicorn.run(
-            "main:app",
-            host="0.0.0.0",
-            port=8000,
-            reload=True
-    )
+    else:
+        workers = 2 * (os.cpu_count() or 1) + 1
+        try:
+            # gunicorn supervises the uvicorn workers; --preload imports the
+            # app once so workers share it, while the database pool and
+            # background tasks are still created per worker at startup
+            os.execvp("gunicorn", [
+                "gunicorn", "-k", "uvicorn.workers.UvicornWorker",
+                "-w", str(workers), "--preload",
+                "--bind", f"{settings.HOST}:{settings.PORT}",
+                "src.main:handler",
+            ])
+        except FileNotFoundError:
+            # gunicorn is not installed: let uvicorn manage the processes
+            uvicorn.run(
+                "src.main:handler",
+                host=settings.HOST,
+                port=settings.PORT,
+                workers=workers,
+                log_level=settings.LOG_LEVEL.lower()
+            )
@@ -0,0 +1,165 @@
+"""
+Write coalescing for interaction records.
+Concurrent requests hand their interaction rows to a background task that
+inserts them in batches with one executemany INSERT and one commit, instead of
+one session and commit per row. Callers still get their new row id back.
+"""
+from src.core.config import get_settings
+from src.infrastructure.database import db_service
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+class InteractionBatcher:
+    """Collects interaction rows and inserts them in bulk"""
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self.max_batch = settings.INTERACTION_BATCH_SIZE
+        self.max_wait = settings.INTERACTION_BATCH_WAIT
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Batch the worker is currently writing, so stop() can fail it if the
+        # worker has to be cancelled mid-write
+        self._inflight: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        """Spawn the flush task (idempotent)"""
+        self._spawn()
+
+    def _spawn(self):
+        """Create the flush task on the running loop unless already running"""
+        if self.running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._worker = asyncio.create_task(self._run(), name="interaction-batcher")
+
+    async def stop(self, timeout: float = 5.0):
+        """Flush what is queued, then stop the flush task"""
+        if not self.running:
+            return
+        # None tells the worker to flush its current batch and exit
+        await self._queue.put(None)
+        try:
+            await asyncio.wait_for(self._worker, timeout)
+        except asyncio.TimeoutError:
+            # wait_for cancelled the worker; let it unwind, then fail the
+            # batch it was writing so those callers don't wait forever
+            logger.warning("Interaction batcher did not stop in time")
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._fail(self._inflight, RuntimeError("Interaction batcher stopped before the write completed"))
+            self._inflight = []
+        self._worker = None
+        await self.flush_now()
+
+    async def add(self, interaction_data: Dict[str, Any]) -> int:
+        """
+        Queue an interaction row and wait for it to be inserted.
+
+        Args:
+            interaction_data: Row accepted by db_service.create_interaction
+
+        Returns:
+            The new interaction id
+        """
+        # Normally started with the app; start lazily otherwise
+        self._spawn()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((interaction_data, future))
+        except asyncio.QueueFull:
+            # Backlogged: write this one directly rather than wait for room
+            return await db_service.create_interaction(interaction_data)
+        return await future
+
+    async def flush_now(self):
+        """Insert everything currently queued from the calling task"""
+        if self._queue is None:
+            return
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                batch.append(item)
+        await self._flush(batch)
+
+    async def _run(self):
+        """Pull batches off the queue until told to stop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._inflight = batch
+            await self._flush(batch)
+            self._inflight = []
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Insert a batch and resolve each caller's future with its id"""
+        if not batch:
+            return
+        try:
+            ids = await db_service.create_interactions_bulk([row for row, _ in batch])
+        except Exception as e:
+            # One bad row must not fail every caller in the batch
+            logger.warning(f"Bulk insert of {len(batch)} interactions failed, retrying one by one: {e}")
+            await self._flush_each(batch)
+            return
+        for (_, future), interaction_id in zip(batch, ids):
+            if not future.done():
+                future.set_result(interaction_id)
+        if len(ids) != len(batch):
+            self._fail(
+                batch[len(ids):],
+                RuntimeError(f"Bulk insert returned {len(ids)} ids for {len(batch)} interactions")
+            )
+
+    async def _flush_each(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Insert rows individually so each caller gets its own result"""
+        for row, future in batch:
+            if future.done():
+                continue
+            try:
+                interaction_id = await db_service.create_interaction(row)
+            except Exception as e:
+                logger.warning(f"Failed to store interaction: {e}")
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(interaction_id)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Dict[str, Any], asyncio.Future]], error: Exception):
+        """Fail every still-pending future in batch"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+# Create singleton instance
+interaction_batcher = InteractionBatcher()
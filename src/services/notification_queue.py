@@ -0,0 +1,103 @@
+"""
+Background notification queue.
+Route handlers enqueue notification jobs and return immediately; a small pool of
+worker tasks drains the queue and performs the SMTP sends off the request path.
+"""
+from src.core.config import get_settings
+from src.services.notification_service import notification_service
+from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Notification kind -> notification_service method name
+NOTIFICATION_HANDLERS = {
+    "booking_confirmation": "send_booking_confirmation",
+    "service_notification": "send_service_notification",
+    "reminder": "send_reminder",
+    "welcome": "send_welcome_email",
+    "feedback_request": "send_feedback_request",
+}
+
+class NotificationQueue:
+    """In-process queue of notification jobs drained by background workers"""
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not worker.done() for worker in self._workers)
+
+    async def start(self, workers: Optional[int] = None):
+        """Spawn the worker tasks (idempotent)"""
+        self._spawn(workers)
+
+    def _spawn(self, workers: Optional[int] = None):
+        """Create the worker tasks on the running loop unless already running"""
+        if self.running:
+            return
+        count = workers or settings.NOTIFY_WORKERS
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"notification-worker-{i}")
+            for i in range(count)
+        ]
+        logger.info(f"Started {count} notification workers")
+
+    async def stop(self, timeout: float = 5.0):
+        """Give queued jobs a chance to finish, then cancel the workers"""
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {self._queue.qsize()} pending notifications on shutdown")
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def enqueue(self, kind: str, **kwargs) -> bool:
+        """
+        Queue a notification without waiting for it to be sent.
+
+        Args:
+            kind: Key of NOTIFICATION_HANDLERS
+            **kwargs: Arguments for the notification_service method
+
+        Returns:
+            True if queued, False if the queue was full and the job was dropped
+        """
+        # Workers are normally started with the app; start lazily otherwise
+        self._spawn()
+        try:
+            self._queue.put_nowait({"kind": kind, "kwargs": kwargs})
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Notification queue full, dropping {kind} notification")
+            return False
+
+    async def _worker(self):
+        """Send queued notifications one at a time until cancelled"""
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._dispatch(item)
+            except Exception as e:
+                logger.warning(f"Failed to send {item['kind']} notification: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch(self, item: Dict[str, Any]):
+        """Route a job to its notification_service method"""
+        method = getattr(notification_service, NOTIFICATION_HANDLERS[item["kind"]])
+        await method(**item["kwargs"])
+
+# Create singleton instance
+notification_queue = NotificationQueue()
@@ -11,10 +11,11 @@ import tempfile
 import os
 import io
 from gtts import gTTS
-from typing import Tuple, Optional, BinaryIO
+from typing import Tuple, Optional, BinaryIO, Union
 import asyncio
 import aiofiles
 from src.core.config import get_settings
+from src.infrastructure import aio_storage
 from src.domain.exceptions import SpeechRecognitionError, TextToSpeechError
 from src.models.schemas import LanguageCode
 import logging
@@ -27,6 +28,16 @@ DetectorFactory.seed = 0
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Raw audio bytes, or a seekable binary file such as an upload spool
+AudioInput = Union[bytes, BinaryIO]
+
+def _audio_stream(audio_data: AudioInput) -> BinaryIO:
+    """Return a readable stream positioned at the start of the audio"""
+    if isinstance(audio_data, (bytes, bytearray)):
+        return io.BytesIO(audio_data)
+    audio_data.seek(0)
+    return audio_data
+
 class FreeSpeechService:
     """Speech service using only free APIs and libraries"""
     
@@ -96,14 +107,14 @@ class FreeSpeechService:
 
     async def speech_to_text(
         self, 
-        audio_data: bytes,
+        audio_data: AudioInput,
         language: str = "en-IN"
     ) -> Tuple[str, float]:
         """
         Convert speech to text using Google's free Speech Recognition API.
         
         Args:
-            audio_data: Binary audio data
+            audio_data: Binary audio data or a seekable file-like object
             language: Language code (e.g., 'en-IN', 'hi-IN')
             
         Returns:
@@ -115,47 +126,34 @@ class FreeSpeechService:
             raise SpeechRecognitionError("Speech recognition service not available")
             
         try:
-            # Create temporary audio file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_file.write(audio_data)
-                temp_file_path = temp_file.name
+            # Load audio straight from memory or the upload spool
+            with sr.AudioFile(_audio_stream(audio_data)) as source:
+                # Adjust for ambient noise
+                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                audio = self.recognizer.record(source)
 
+            # Use Google's free speech recognition
+            lang_code = self.speech_to_text_langs.get(language, "en-IN")
+            
+            # Use the recognizer with proper error handling
             try:
-                # Load audio file
-                with sr.AudioFile(temp_file_path) as source:
-                    # Adjust for ambient noise
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                    audio = self.recognizer.record(source)
-
-                # Use Google's free speech recognition
-                lang_code = self.speech_to_text_langs.get(language, "en-IN")
+                # The recognize_google method should be available in speech_recognition
+                text = self.recognizer.recognize_google(audio, language=lang_code)
+                logger.info(f"Speech recognized: '{text}' in language {lang_code}")
+                return str(text), 1.0  # Free API doesn't provide confidence
                 
-                # Use the recognizer with proper error handling
-                try:
-                    # The recognize_google method should be available in speech_recognition
-                    text = self.recognizer.recognize_google(audio, language=lang_code)
-                    logger.info(f"Speech recognized: '{text}' in language {lang_code}")
-                    return str(text), 1.0  # Free API doesn't provide confidence
-                    
-                except AttributeError as attr_error:
-                    logger.error(f"Speech recognition method not available: {attr_error}")
-                    raise SpeechRecognitionError("Google Speech Recognition not available in this installation")
-                except sr.UnknownValueError:
-                    logger.error("Speech could not be understood")
-                    raise SpeechRecognitionError("Speech could not be understood") 
-                except sr.RequestError as req_error:
-                    logger.error(f"Google Speech Recognition service error: {req_error}")
-                    raise SpeechRecognitionError(f"Speech recognition service error: {req_error}")
-                except Exception as recognition_error:
-                    logger.error(f"Speech recognition error: {recognition_error}")
-                    raise SpeechRecognitionError(f"Recognition failed: {recognition_error}")
-
-            finally:
-                # Clean up temp file
-                try:
-                    os.remove(temp_file_path)
-                except:
-                    pass
+            except AttributeError as attr_error:
+                logger.error(f"Speech recognition method not available: {attr_error}")
+                raise SpeechRecognitionError("Google Speech Recognition not available in this installation")
+            except sr.UnknownValueError:
+                logger.error("Speech could not be understood")
+                raise SpeechRecognitionError("Speech could not be understood") 
+            except sr.RequestError as req_error:
+                logger.error(f"Google Speech Recognition service error: {req_error}")
+                raise SpeechRecognitionError(f"Speech recognition service error: {req_error}")
+            except Exception as recognition_error:
+                logger.error(f"Speech recognition error: {recognition_error}")
+                raise SpeechRecognitionError(f"Recognition failed: {recognition_error}")
 
         except sr.UnknownValueError:
             logger.error("Speech could not be understood")
@@ -328,13 +326,10 @@ class FreeSpeechService:
             Full path to saved file
         """
         try:
-            # Ensure audio storage directory exists
-            os.makedirs(settings.AUDIO_STORAGE, exist_ok=True)
-            
             file_path = os.path.join(settings.AUDIO_STORAGE, filename)
             
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(audio_data)
+            # One thread hand-off per file; the storage directory is created on demand
+            await aio_storage.write_audio(file_path, audio_data)
             
             logger.info(f"Audio file saved: {file_path}")
             return file_path
@@ -347,42 +342,29 @@ class FreeSpeechService:
         """Get list of supported languages"""
         return list(self.speech_to_text_langs.keys())
 
-    async def validate_audio_format(self, audio_data: bytes) -> bool:
+    async def validate_audio_format(self, audio_data: AudioInput) -> bool:
         """
         Validate if audio data is in a supported format.
         
         Args:
-            audio_data: Audio data to validate
+            audio_data: Audio bytes or seekable file-like object to validate
             
         Returns:
             True if valid, False otherwise
         """
         try:
-            # Create temporary file to test
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_file.write(audio_data)
-                temp_file_path = temp_file.name
-
-            try:
-                # Try to read as audio file if speech recognition is available
-                if sr is not None and self.recognizer is not None:
-                    with sr.AudioFile(temp_file_path) as source:
-                        self.recognizer.record(source, duration=0.1)
-                    return True
-                else:
-                    # Basic validation by checking file header
-                    if len(audio_data) > 44:  # Minimum WAV header size
-                        return audio_data[:4] == b'RIFF' and audio_data[8:12] == b'WAVE'
-                    return False
-                
-            except Exception:
+            stream = _audio_stream(audio_data)
+            # Try to read as audio file if speech recognition is available
+            if sr is not None and self.recognizer is not None:
+                with sr.AudioFile(stream) as source:
+                    self.recognizer.record(source, duration=0.1)
+                return True
+            else:
+                # Basic validation by checking file header
+                header = stream.read(45)
+                if len(header) > 44:  # Minimum WAV header size
+                    return header[:4] == b'RIFF' and header[8:12] == b'WAVE'
                 return False
-                
-            finally:
-                try:
-                    os.remove(temp_file_path)
-                except:
-                    pass
 
         except Exception:
             return False
@@ -4,9 +4,10 @@ text-to-speech, sentiment analysis, and business logic.
 """
 import asyncio
 from typing import Optional, Tuple, Dict, Any, List
-from src.services.speech_service import speech_service
+from src.services.speech_service import speech_service, AudioInput
 from src.utils.sentiment_analyzer import sentiment_analyzer
 from src.infrastructure.database import db_service
+from src.services.interaction_batcher import interaction_batcher
 from src.core.config import get_settings
 from src.domain.exceptions import SpeechRecognitionError, TextToSpeechError
 from src.models.schemas import LanguageCode, InteractionType
@@ -22,11 +23,13 @@ class VoiceService:
     
     def __init__(self):
         self.supported_languages = settings.SUPPORTED_LANGUAGES
+        # Frozen set for the per-request membership checks
+        self._supported_language_set = frozenset(self.supported_languages)
         self.default_language = settings.DEFAULT_LANGUAGE
 
     async def process_voice_input(
         self,
-        audio_data: bytes,
+        audio_data: AudioInput,
         customer_id: Optional[int] = None,
         language: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -38,7 +41,7 @@ class VoiceService:
         4. Store interaction in database
         
         Args:
-            audio_data: Raw audio data bytes
+            audio_data: Raw audio bytes or a seekable file-like object
             customer_id: Optional customer ID
             language: Optional language code
             
@@ -51,7 +54,7 @@ class VoiceService:
                 raise SpeechRecognitionError("Invalid audio format")
 
             # Step 1: Convert speech to text
-            if language and language in self.supported_languages:
+            if language and language in self._supported_language_set:
                 detected_language = language
             else:
                 # Use default language for speech recognition, then detect
@@ -65,9 +68,9 @@ class VoiceService:
             if not language:
                 detected_language = await speech_service.detect_language(text)
 
-            # Step 3: Analyze sentiment
-            sentiment_score = sentiment_analyzer.analyze(text)
+            # Step 3: Analyze sentiment (one scoring pass; the compound score is in the details)
             sentiment_details = sentiment_analyzer.get_detailed_sentiment(text)
+            sentiment_score = sentiment_details['compound']
 
             # Step 4: Store interaction in database
             interaction_id = await self._store_interaction(
@@ -123,7 +126,7 @@ class VoiceService:
         """
         try:
             # Use default language if not specified
-            if not language or language not in self.supported_languages:
+            if not language or language not in self._supported_language_set:
                 language = self.default_language
 
             # Step 1: Convert text to speech
@@ -166,7 +169,7 @@ class VoiceService:
 
     async def process_conversation_turn(
         self,
-        audio_data: bytes,
+        audio_data: AudioInput,
         customer_id: Optional[int] = None,
         language: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None
@@ -308,7 +311,7 @@ class VoiceService:
                 "sentiment_score": sentiment_score
             }
             
-            return await db_service.create_interaction(interaction_data)
+            return await interaction_batcher.add(interaction_data)
             
         except Exception as e:
             logger.error(f"Failed to store interaction: {str(e)}")
@@ -341,7 +344,7 @@ class VoiceService:
             logger.error(f"Failed to get conversation history: {str(e)}")
             return []
 
-    def get_supported_languages(self) -> List[str]:
+    def get_supported_languages(self) -> Tuple[str, ...]:
         """Get list of supported languages"""
         return self.supported_languages
 
@@ -1,10 +1,22 @@
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from functools import lru_cache
 from typing import Dict, Union
 import logging
 
+# Texts up to this length are memoized; chatbot utterances are short and repetitive
+CACHEABLE_TEXT_LENGTH = 512
+
 class SentimentAnalyzer:
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
         self.analyzer = SentimentIntensityAnalyzer()
+        # VADER scores depend only on the text; the cached dicts are treated as read-only
+        self._cached_scores = lru_cache(maxsize=cache_size)(self.analyzer.polarity_scores)
+    
+    def _polarity_scores(self, text: str) -> Dict[str, float]:
+        """VADER polarity scores, served from the LRU cache for short texts"""
+        if len(text) <= CACHEABLE_TEXT_LENGTH:
+            return self._cached_scores(text)
+        return self.analyzer.polarity_scores(text)
     
     def analyze(self, text: str) -> float:
         """
@@ -12,7 +24,7 @@ class SentimentAnalyzer:
         between -1 (negative) and 1 (positive)
         """
         try:
-            sentiment_dict = self.analyzer.polarity_scores(text)
+            sentiment_dict = self._polarity_scores(text)
             return sentiment_dict['compound']
         except Exception as e:
             logging.error(f"Error in sentiment analysis: {e}")
@@ -23,7 +35,7 @@ class SentimentAnalyzer:
         Get detailed sentiment analysis including positive, negative, and neutral scores
         """
         try:
-            scores = self.analyzer.polarity_scores(text)
+            scores = self._polarity_scores(text)
             
             # Determine overall sentiment
             if scores['compound'] >= 0.05: